@@ -0,0 +1,30 @@
+"""
+Shared Rich console for claude-md-bench.
+
+All commands and the reporter print through one Console, so terminal
+capabilities are detected once per process.
+"""
+
+from __future__ import annotations
+
+from contextlib import AbstractContextManager, nullcontext
+
+from rich.console import Console
+
+console = Console()
+
+
+def status(message: str, quiet: bool = False) -> AbstractContextManager[object]:
+    """
+    Show a spinner while a block runs, or nothing in quiet mode.
+
+    Args:
+        message: Status message (Rich markup)
+        quiet: Skip the spinner and its refresh thread entirely
+
+    Returns:
+        Context manager wrapping the block
+    """
+    if quiet:
+        return nullcontext()
+    return console.status(message)
@@ -0,0 +1,58 @@
+"""
+JSON helpers for claude-md-bench.
+
+Uses orjson when it is installed (pip install claude-md-bench[fast]) and
+falls back to the standard library otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, is_dataclass
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAS_ORJSON = False
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON text, as raw bytes or str
+
+    Returns:
+        Parsed Python object
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value: Any) -> str:
+    """
+    Serialize a value to compact JSON text.
+
+    Args:
+        value: JSON serializable object; dataclass instances are written as
+            objects of their fields
+
+    Returns:
+        JSON text
+    """
+    if HAS_ORJSON:
+        # orjson serializes dataclasses natively, without building a dict first
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, default=_dataclass_fields)
+
+
+def _dataclass_fields(value: Any) -> dict[str, Any]:
+    """Fallback encoder for the standard library: dataclass instances to dicts."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
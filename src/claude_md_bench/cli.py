@@ -10,14 +10,12 @@ import logging
 from typing import Annotated
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from claude_md_bench import __version__
+from claude_md_bench._console import console
 from claude_md_bench.commands.audit import audit
 from claude_md_bench.commands.compare import compare
 from claude_md_bench.commands.optimize import optimize
-from claude_md_bench.llm.ollama import OllamaClient
 
 # Configure logging
 logging.basicConfig(
@@ -37,8 +35,6 @@ app.command()(audit)
 app.command()(compare)
 app.command()(optimize)
 
-console = Console()
-
 
 @app.command()
 def version() -> None:
@@ -74,6 +70,11 @@ def check(
         claude-md-bench check
         claude-md-bench check --model llama3.2:latest
     """
+    from rich.table import Table
+    from rich.text import Text
+
+    from claude_md_bench.llm.ollama import OllamaClient
+
     console.print(f"Checking Ollama at [cyan]{host}[/cyan]...")
     console.print()
 
@@ -103,9 +104,9 @@ def check(
 
     for m in sorted(models):
         if model and m == model:
-            table.add_row(m, "[green]✓ Selected[/green]")
+            table.add_row(Text(m), Text("✓ Selected", style="green"))
         else:
-            table.add_row(m, "")
+            table.add_row(Text(m), Text())
 
     console.print(table)
 
@@ -135,6 +136,8 @@ def models(
 
     Quick shortcut to see what models are available for analysis.
     """
+    from claude_md_bench.llm.ollama import OllamaClient
+
     ollama = OllamaClient(host=host)
     available = ollama.list_models()
 
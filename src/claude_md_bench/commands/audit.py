@@ -6,17 +6,13 @@ Analyzes a single CLAUDE.md file and provides quality assessment.
 
 from __future__ import annotations
 
+from datetime import datetime
 from pathlib import Path
 from typing import Annotated
 
 import typer
-from rich.console import Console
 
-from claude_md_bench.core.analyzer import ClaudeMDAnalyzer
-from claude_md_bench.core.reporter import Reporter
-from claude_md_bench.llm.ollama import OllamaClient, OllamaConnectionError
-
-console = Console()
+from claude_md_bench._console import console, status
 
 
 def audit(
@@ -80,6 +76,13 @@ def audit(
             help="Suppress console output (only save reports)",
         ),
     ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help="Always query Ollama instead of reusing cached analyses",
+        ),
+    ] = False,
 ) -> None:
     """
     Audit a single CLAUDE.md file for quality and completeness.
@@ -91,45 +94,55 @@ def audit(
         claude-md-bench audit ~/.claude/CLAUDE.md
         claude-md-bench audit ./CLAUDE.md --format html --output-dir ./reports
     """
+    # Deferred so `--help` and the other commands skip the requests/jinja2 import cost
+    from claude_md_bench.core.analyzer import ClaudeMDAnalyzer
+    from claude_md_bench.core.cache import AnalysisCache
+    from claude_md_bench.core.reporter import Reporter
+    from claude_md_bench.llm.ollama import OllamaClient, OllamaConnectionError
+
     # Use parent directory name as project name
     project_name = file.parent.name
 
-    # Initialize Ollama client
-    with console.status("[cyan]Connecting to Ollama...[/cyan]"):
-        ollama = OllamaClient(
-            host=host,
-            model=model,
-            timeout=timeout,
-        )
-
-        try:
-            if not ollama.check_health():
-                console.print(f"[red]Error:[/red] Cannot connect to Ollama at {host}")
+    ollama = OllamaClient(
+        host=host,
+        model=model,
+        timeout=timeout,
+    )
+    analyzer = ClaudeMDAnalyzer(ollama, cache=None if no_cache else AnalysisCache())
+
+    # An unchanged file analyzed before with this model needs no Ollama round trip
+    if analyzer.cached_analysis(file, project_name) is not None:
+        if not quiet:
+            console.print(f"[green]✓[/green] Using cached analysis (model: {model})")
+            console.print()
+    else:
+        with status("[cyan]Connecting to Ollama...[/cyan]", quiet):
+            try:
+                if not ollama.check_health():
+                    console.print(f"[red]Error:[/red] Cannot connect to Ollama at {host}")
+                    console.print("Ensure Ollama is running: [cyan]ollama serve[/cyan]")
+
+                    # Check if model is available
+                    available_models = ollama.list_models()
+                    if available_models:
+                        console.print(f"\nAvailable models: {', '.join(available_models)}")
+                        if model not in available_models:
+                            console.print(f"\nModel '{model}' not found. Pull it with:")
+                            console.print(f"  [cyan]ollama pull {model}[/cyan]")
+
+                    raise typer.Exit(1)
+            except OllamaConnectionError as e:
+                console.print(f"[red]Connection error:[/red] {e}")
                 console.print("Ensure Ollama is running: [cyan]ollama serve[/cyan]")
+                raise typer.Exit(1) from None
 
-                # Check if model is available
-                available_models = ollama.list_models()
-                if available_models:
-                    console.print(f"\nAvailable models: {', '.join(available_models)}")
-                    if model not in available_models:
-                        console.print(f"\nModel '{model}' not found. Pull it with:")
-                        console.print(f"  [cyan]ollama pull {model}[/cyan]")
-
-                raise typer.Exit(1)
-        except OllamaConnectionError as e:
-            console.print(f"[red]Connection error:[/red] {e}")
-            console.print("Ensure Ollama is running: [cyan]ollama serve[/cyan]")
-            raise typer.Exit(1) from None
-
-    if not quiet:
-        console.print(f"[green]✓[/green] Ollama ready (model: {model})")
-        console.print()
+        if not quiet:
+            console.print(f"[green]✓[/green] Ollama ready (model: {model})")
+            console.print()
 
     # Run analysis
-    analyzer = ClaudeMDAnalyzer(ollama)
-
     try:
-        with console.status("[cyan]Analyzing CLAUDE.md file...[/cyan]"):
+        with status("[cyan]Analyzing CLAUDE.md file...[/cyan]", quiet):
             result = analyzer.analyze(
                 claude_md_path=file,
                 project_name=project_name,
@@ -152,15 +165,16 @@ def audit(
     if not quiet:
         reporter.print_audit(result, file)
 
-    # Save reports
+    # Save reports; one timestamp names both formats of this result
     saved_paths: list[Path] = []
+    generated_at = datetime.now()
 
     if output_format in ("text", "both"):
-        text_path = reporter.save_audit_text_report(result, file)
+        text_path = reporter.save_audit_text_report(result, file, timestamp=generated_at)
         saved_paths.append(text_path)
 
     if output_format in ("html", "both"):
-        html_path = reporter.save_audit_html_report(result, file)
+        html_path = reporter.save_audit_html_report(result, file, timestamp=generated_at)
         if html_path:
             saved_paths.append(html_path)
 
@@ -6,17 +6,13 @@ Compares two CLAUDE.md files and determines which is better.
 
 from __future__ import annotations
 
+from datetime import datetime
 from pathlib import Path
 from typing import Annotated
 
 import typer
-from rich.console import Console
 
-from claude_md_bench.core.analyzer import ClaudeMDAnalyzer
-from claude_md_bench.core.reporter import Reporter
-from claude_md_bench.llm.ollama import OllamaClient, OllamaConnectionError
-
-console = Console()
+from claude_md_bench._console import console, status
 
 
 def compare(
@@ -105,6 +101,13 @@ def compare(
             help="Suppress console output (only save reports)",
         ),
     ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help="Always query Ollama instead of reusing cached analyses",
+        ),
+    ] = False,
 ) -> None:
     """
     Compare two CLAUDE.md files and determine which is better.
@@ -112,44 +115,62 @@ def compare(
     Analyzes both files on 5 dimensions (Clarity, Completeness, Actionability,
     Standards, Context) and provides detailed feedback with strengths and weaknesses.
 
+    Both files are analyzed concurrently. Start Ollama with OLLAMA_NUM_PARALLEL=2
+    (or higher) so the server runs both requests at once instead of queueing them.
+
     Example:
         claude-md-bench compare ~/.claude/CLAUDE.md ~/project/CLAUDE.md
     """
+    # Deferred so `--help` and the other commands skip the requests/jinja2 import cost
+    from claude_md_bench.core.analyzer import ClaudeMDAnalyzer
+    from claude_md_bench.core.cache import AnalysisCache
+    from claude_md_bench.core.reporter import Reporter
+    from claude_md_bench.llm.ollama import OllamaClient, OllamaConnectionError
+
     # Use parent directory names if display names not provided
     project_name_a = name_a or file_a.parent.name
     project_name_b = name_b or file_b.parent.name
 
-    # Initialize Ollama client
-    with console.status("[cyan]Connecting to Ollama...[/cyan]"):
-        ollama = OllamaClient(
-            host=host,
-            model=model,
-            timeout=timeout,
-        )
-
-        if not ollama.check_health():
-            console.print(f"[red]Error:[/red] Cannot connect to Ollama at {host}")
-            console.print("Ensure Ollama is running: [cyan]ollama serve[/cyan]")
-
-            # Check if model is available
-            available_models = ollama.list_models()
-            if available_models:
-                console.print(f"\nAvailable models: {', '.join(available_models)}")
-                if model not in available_models:
-                    console.print(f"\nModel '{model}' not found. Pull it with:")
-                    console.print(f"  [cyan]ollama pull {model}[/cyan]")
-
-            raise typer.Exit(1)
-
-    if not quiet:
-        console.print(f"[green]✓[/green] Ollama ready (model: {model})")
-        console.print()
+    ollama = OllamaClient(
+        host=host,
+        model=model,
+        timeout=timeout,
+    )
+    analyzer = ClaudeMDAnalyzer(ollama, cache=None if no_cache else AnalysisCache())
+
+    # Skip connecting when both files were analyzed before with this model
+    fully_cached = (
+        analyzer.cached_analysis(file_a, project_name_a) is not None
+        and analyzer.cached_analysis(file_b, project_name_b) is not None
+    )
+
+    if fully_cached:
+        if not quiet:
+            console.print(f"[green]✓[/green] Using cached analyses (model: {model})")
+            console.print()
+    else:
+        with status("[cyan]Connecting to Ollama...[/cyan]", quiet):
+            if not ollama.check_health():
+                console.print(f"[red]Error:[/red] Cannot connect to Ollama at {host}")
+                console.print("Ensure Ollama is running: [cyan]ollama serve[/cyan]")
+
+                # Check if model is available
+                available_models = ollama.list_models()
+                if available_models:
+                    console.print(f"\nAvailable models: {', '.join(available_models)}")
+                    if model not in available_models:
+                        console.print(f"\nModel '{model}' not found. Pull it with:")
+                        console.print(f"  [cyan]ollama pull {model}[/cyan]")
+
+                raise typer.Exit(1)
+
+        if not quiet:
+            console.print(f"[green]✓[/green] Ollama ready (model: {model})")
+            console.print()
 
     # Run comparison
-    analyzer = ClaudeMDAnalyzer(ollama)
-
     try:
-        with console.status("[cyan]Analyzing CLAUDE.md files...[/cyan]"):
+        with status("[cyan]Analyzing CLAUDE.md files...[/cyan]", quiet):
             result = analyzer.compare(
                 claude_md_a=file_a,
                 claude_md_b=file_b,
@@ -182,15 +203,16 @@ def compare(
     if not quiet:
         reporter.print_comparison(result)
 
-    # Save reports
+    # Save reports; one timestamp names both formats of this result
     saved_paths: list[Path] = []
+    generated_at = datetime.now()
 
     if output_format in ("text", "both"):
-        text_path = reporter.save_text_report(result)
+        text_path = reporter.save_text_report(result, timestamp=generated_at)
         saved_paths.append(text_path)
 
     if output_format in ("html", "both"):
-        html_path = reporter.save_html_report(result)
+        html_path = reporter.save_html_report(result, timestamp=generated_at)
         if html_path:
             saved_paths.append(html_path)
 
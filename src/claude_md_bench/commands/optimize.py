@@ -7,18 +7,18 @@ Iteratively improves a CLAUDE.md file using meta-prompting.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
+from rich.text import Text
 
-from claude_md_bench.core.optimizer import ClaudeMDOptimizer, OptimizationResult
-from claude_md_bench.llm.ollama import OllamaClient, OllamaConnectionError
+from claude_md_bench._console import console, status
 
-console = Console()
+if TYPE_CHECKING:
+    from claude_md_bench.core.optimizer import OptimizationResult
 
 
 def optimize(
@@ -43,6 +43,30 @@ def optimize(
             max=10,
         ),
     ] = 3,
+    candidates: Annotated[
+        int,
+        typer.Option(
+            "--candidates",
+            "-k",
+            help="Rewrite candidates generated and scored in parallel per iteration",
+            min=1,
+            max=5,
+        ),
+    ] = 1,
+    speculate: Annotated[
+        bool,
+        typer.Option(
+            "--speculate",
+            help="Start each next rewrite while the current one is still being scored",
+        ),
+    ] = False,
+    fused: Annotated[
+        bool,
+        typer.Option(
+            "--fused",
+            help="Score each version and draft the next one in a single Ollama call",
+        ),
+    ] = False,
     model: Annotated[
         str,
         typer.Option(
@@ -91,12 +115,35 @@ def optimize(
     Iteratively evaluates and improves the file, targeting weak areas
     identified in each evaluation round.
 
+    With --candidates K, each iteration generates K rewrites concurrently
+    and keeps the best-scoring one. Start Ollama with OLLAMA_NUM_PARALLEL=K
+    so the server runs them in parallel instead of queueing them.
+
+    With --speculate, the next rewrite is drafted from the previous feedback
+    while the current version is scored, and kept when the weakest dimension
+    is unchanged. This also needs OLLAMA_NUM_PARALLEL=2 or higher.
+
+    With --fused, each Ollama call both scores the current version and drafts
+    the next one, roughly halving the number of calls. Intermediate scores then
+    come from the combined prompt; the final version is scored normally.
+
     Example:
         claude-md-bench optimize ~/.claude/CLAUDE.md
         claude-md-bench optimize CLAUDE.md --iterations 5 --model qwen2.5:32b
+        claude-md-bench optimize CLAUDE.md --candidates 3
+        claude-md-bench optimize CLAUDE.md --speculate
+        claude-md-bench optimize CLAUDE.md --fused
     """
+    if sum((candidates > 1, speculate, fused)) > 1:
+        console.print("[red]Error:[/red] --candidates, --speculate and --fused are exclusive")
+        raise typer.Exit(1)
+
+    # Deferred so `--help` and the other commands skip the requests/jinja2 import cost
+    from claude_md_bench.core.optimizer import ClaudeMDOptimizer
+    from claude_md_bench.llm.ollama import OllamaClient, OllamaConnectionError
+
     # Initialize Ollama client
-    with console.status("[cyan]Connecting to Ollama...[/cyan]"):
+    with status("[cyan]Connecting to Ollama...[/cyan]", quiet):
         ollama = OllamaClient(
             host=host,
             model=model,
@@ -130,10 +177,16 @@ def optimize(
                 Panel.fit(
                     f"[bold cyan]Optimizing CLAUDE.md[/bold cyan]\n"
                     f"File: {file}\n"
-                    f"Iterations: {iterations}",
+                    f"Iterations: {iterations}"
+                    + (f"\nCandidates per iteration: {candidates}" if candidates > 1 else ""),
                     border_style="cyan",
                 )
             )
+            if candidates > 1 or speculate:
+                console.print(
+                    f"[dim]Tip: set OLLAMA_NUM_PARALLEL={max(candidates, 2)} on the Ollama "
+                    "server so requests run in parallel[/dim]"
+                )
             console.print()
 
         with Progress(
@@ -141,6 +194,7 @@ def optimize(
             TextColumn("[progress.description]{task.description}"),
             console=console,
             transient=True,
+            disable=quiet,
         ) as progress:
             task = progress.add_task(
                 f"[cyan]Running {iterations} optimization iterations...",
@@ -151,6 +205,11 @@ def optimize(
                 claude_md_path=file,
                 iterations=iterations,
                 output_path=output,
+                parallel_candidates=candidates,
+                speculative=speculate,
+                fused=fused,
+                # Only the final version is shown and saved
+                keep_history=False,
             )
 
             progress.update(task, completed=True)
@@ -200,19 +259,18 @@ def _print_optimization_result(result: OptimizationResult) -> None:
     table.add_column("Delta", justify="right")
     table.add_column("Status", justify="center")
 
+    # Text cells are added as-is, skipping Rich's markup parser for every row
     for iteration in result.iterations:
-        delta_str = f"{iteration.delta:+.1f}"
         delta_color = "green" if iteration.delta > 0 else "red" if iteration.delta < 0 else "white"
 
         # Determine best iteration
         is_best = iteration.score == result.final_score
-        status = "[green]Best[/green]" if is_best else ""
 
         table.add_row(
-            str(iteration.iteration),
-            f"{iteration.score:.1f}/100",
-            f"[{delta_color}]{delta_str}[/{delta_color}]",
-            status,
+            Text(str(iteration.iteration)),
+            Text(f"{iteration.score:.1f}/100"),
+            Text(f"{iteration.delta:+.1f}", style=delta_color),
+            Text("Best", style="green") if is_best else Text(),
         )
 
     console.print(table)
@@ -6,17 +6,21 @@ Analyzes CLAUDE.md files for quality and completeness using LLM evaluation.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from dataclasses import dataclass, field
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
+from claude_md_bench.core.cache import AnalysisCache
 from claude_md_bench.llm.ollama import OllamaClient
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Result of analyzing a single CLAUDE.md file."""
 
@@ -30,7 +34,7 @@ class AnalysisResult:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ComparisonResult:
     """Result of comparing two CLAUDE.md files."""
 
@@ -45,19 +49,110 @@ class ClaudeMDAnalyzer:
 
     DIMENSIONS = ["clarity", "completeness", "actionability", "standards", "context"]
 
-    def __init__(self, ollama_client: OllamaClient) -> None:
+    # "CLARITY: 85", "**1. Clarity**: 85", "### 1. Clarity (85/100)", "Score for Clarity: 85"
+    # and similar score lines: any text without a colon or parenthesis may precede the metric,
+    # and a label parenthetical such as "(0-100)" may sit between the metric and the colon
+    _SCORE_RE = re.compile(
+        r"^[^\n:(]*?\b"
+        r"(?P<metric>clarity|completeness|actionability|standards|context|overall)\b"
+        r"(?:[^\n:(]|\([^)\n]*\))*?(?::[\s*]*(?P<colon>\d+(?:\.\d+)?)|\((?P<paren>\d+(?:\.\d+)?)/)",
+        re.IGNORECASE | re.MULTILINE,
+    )
+
+    # A section header followed by its bullet lines (blank lines allowed in between)
+    _SECTIONS_RE = re.compile(
+        r"(?P<section>strengths|weaknesses|recommendations):[^\n]*\n"
+        r"(?P<block>(?:[^\S\n]*-[^\n]*(?:\n|$)|[^\S\n]*\n)+)",
+        re.IGNORECASE,
+    )
+
+    _SYSTEM_PROMPT = """You are an expert at evaluating CLAUDE.md files for AI coding assistants.
+
+A good CLAUDE.md file should:
+1. **Be Clear & Specific**: Explicit commands, patterns, and examples
+2. **Cover Key Areas**: Testing, quality checks, architecture, common pitfalls
+3. **Be Actionable**: Concrete instructions, not vague guidelines
+4. **Include Standards**: TDD workflow, type safety, code quality requirements
+5. **Provide Context**: Project structure, common commands, troubleshooting
+
+Evaluate files on these dimensions and provide constructive feedback."""
+
+    # Filled with str.format; only the file-specific fields vary between calls
+    _ANALYSIS_TEMPLATE = """# CLAUDE.md File Analysis
+
+## Project Context
+**Project**: {project_name}
+**File Size**: {char_count} characters, {line_count} lines
+
+## File Content
+```markdown
+{truncated_content}
+```
+
+## Your Task
+
+Analyze this CLAUDE.md file and provide scores (0-100) for:
+
+1. **Clarity** (0-100): Are instructions clear and specific?
+2. **Completeness** (0-100): Covers all essential areas?
+3. **Actionability** (0-100): Provides concrete, executable guidance?
+4. **Standards** (0-100): Enforces quality standards (TDD, types, testing)?
+5. **Context** (0-100): Adequate project context and structure?
+
+Then provide:
+- **Overall Score** (0-100): Weighted average
+- **Strengths**: What this file does well (3-5 points)
+- **Weaknesses**: What could be improved (3-5 points)
+- **Recommendations**: Specific improvements (3-5 points)
+
+Format your response as:
+
+CLARITY: <score 0-100>
+COMPLETENESS: <score 0-100>
+ACTIONABILITY: <score 0-100>
+STANDARDS: <score 0-100>
+CONTEXT: <score 0-100>
+OVERALL: <score 0-100>
+
+STRENGTHS:
+- <strength 1>
+- <strength 2>
+- <strength 3>
+
+WEAKNESSES:
+- <weakness 1>
+- <weakness 2>
+- <weakness 3>
+
+RECOMMENDATIONS:
+- <recommendation 1>
+- <recommendation 2>
+- <recommendation 3>
+
+DETAILED_ANALYSIS:
+<Your detailed analysis here>
+"""
+
+    def __init__(
+        self,
+        ollama_client: OllamaClient,
+        cache: AnalysisCache | None = None,
+    ) -> None:
         """
         Initialize analyzer.
 
         Args:
             ollama_client: Ollama client for LLM analysis
+            cache: Optional cache for reusing results of identical requests
         """
         self.ollama = ollama_client
+        self.cache = cache
 
     def analyze(
         self,
         claude_md_path: Path,
         project_name: str = "Unknown",
+        include_details: bool = True,
     ) -> AnalysisResult:
         """
         Analyze a single CLAUDE.md file for quality and completeness.
@@ -65,6 +160,8 @@ class ClaudeMDAnalyzer:
         Args:
             claude_md_path: Path to CLAUDE.md file
             project_name: Name of project for context
+            include_details: If False, stop generation once the scores and bullet
+                lists are complete and skip the DETAILED_ANALYSIS section
 
         Returns:
             Analysis result with scores and recommendations
@@ -88,15 +185,46 @@ class ClaudeMDAnalyzer:
                 error=str(e),
             )
 
+        return self.analyze_content(content, project_name, include_details)
+
+    def analyze_content(
+        self,
+        content: str,
+        project_name: str = "Unknown",
+        include_details: bool = True,
+    ) -> AnalysisResult:
+        """
+        Analyze CLAUDE.md content that is already in memory.
+
+        Args:
+            content: CLAUDE.md text
+            project_name: Name of project for context
+            include_details: If False, stop generation once the scores and bullet
+                lists are complete and skip the DETAILED_ANALYSIS section
+
+        Returns:
+            Analysis result with scores and recommendations
+        """
         # Build analysis prompt
         prompt = self._build_analysis_prompt(content, project_name)
+        system = self._get_system_prompt()
+
+        cache_key: str | None = None
+        if self.cache is not None and include_details:
+            cache_key = self.cache.make_key(self.ollama.model, system, prompt)
+            cached = self._result_from_cache(self.cache.get(cache_key))
+            if cached is not None:
+                logger.info(f"Using cached analysis for {project_name}")
+                return cached
 
         # Get LLM analysis
         try:
             response = self.ollama.generate(
                 prompt=prompt,
-                system=self._get_system_prompt(),
+                system=system,
                 temperature=0.3,
+                # The scored sections come first, so stop once the free-form tail starts
+                stream_until=None if include_details else "DETAILED_ANALYSIS:",
             )
 
             logger.debug(f"Raw LLM response (first 500 chars):\n{response[:500]}")
@@ -107,6 +235,10 @@ class ClaudeMDAnalyzer:
             logger.info(f"Analysis complete: score={result.score:.1f}/100")
             logger.debug(f"Dimension scores: {result.dimension_scores}")
 
+            # Only cache responses that parsed into scores
+            if self.cache is not None and cache_key is not None and result.dimension_scores:
+                self.cache.put(cache_key, result)
+
             return result
 
         except Exception as e:
@@ -117,6 +249,131 @@ class ClaudeMDAnalyzer:
                 error=str(e),
             )
 
+    def cached_analysis(
+        self,
+        claude_md_path: Path,
+        project_name: str = "Unknown",
+    ) -> AnalysisResult | None:
+        """
+        Look up the cached result analyze() would return, without calling Ollama.
+
+        Args:
+            claude_md_path: Path to CLAUDE.md file
+            project_name: Name of project for context
+
+        Returns:
+            Cached analysis result, or None if there is no cache entry
+        """
+        if self.cache is None:
+            return None
+
+        try:
+            content = claude_md_path.read_text(encoding="utf-8")
+        except Exception:
+            return None
+
+        prompt = self._build_analysis_prompt(content, project_name)
+        return self._result_from_cache(
+            self.cache.get(
+                self.cache.make_key(self.ollama.model, self._get_system_prompt(), prompt)
+            )
+        )
+
+    @staticmethod
+    def _result_from_cache(cached: dict[str, Any] | None) -> AnalysisResult | None:
+        """Rebuild a cached AnalysisResult; entries from another schema count as misses."""
+        if cached is None:
+            return None
+        try:
+            return AnalysisResult(**cached)
+        except TypeError as e:
+            logger.warning(f"Ignoring stale analysis cache entry: {e}")
+            return None
+
+    async def aanalyze(
+        self,
+        claude_md_path: Path,
+        project_name: str = "Unknown",
+    ) -> AnalysisResult:
+        """
+        Analyze a CLAUDE.md file without blocking the event loop.
+
+        The blocking Ollama request runs in a worker thread, so several
+        analyses can be awaited together and overlap on the server.
+
+        Args:
+            claude_md_path: Path to CLAUDE.md file
+            project_name: Name of project for context
+
+        Returns:
+            Analysis result with scores and recommendations
+        """
+        return await asyncio.to_thread(self.analyze, claude_md_path, project_name)
+
+    async def aanalyze_many(self, items: list[tuple[Path, str]]) -> list[AnalysisResult]:
+        """
+        Analyze several CLAUDE.md files concurrently.
+
+        The Ollama client caps how many requests are in flight at once
+        (OLLAMA_NUM_PARALLEL), so large batches queue locally, not on the server.
+
+        Args:
+            items: (path, project name) pairs to analyze
+
+        Returns:
+            Analysis results in the same order as items
+        """
+        return list(await asyncio.gather(*(self.aanalyze(path, name) for path, name in items)))
+
+    def analyze_many(self, items: list[tuple[Path, str]]) -> list[AnalysisResult]:
+        """
+        Analyze several CLAUDE.md files concurrently in worker threads.
+
+        Safe to call from a running event loop. The Ollama client still caps how
+        many requests are in flight at once (OLLAMA_NUM_PARALLEL).
+
+        Args:
+            items: (path, project name) pairs to analyze
+
+        Returns:
+            Analysis results in the same order as items
+        """
+        with ThreadPoolExecutor() as pool:
+            return list(pool.map(lambda item: self.analyze(*item), items))
+
+    async def acompare(
+        self,
+        claude_md_a: Path,
+        claude_md_b: Path,
+        project_name_a: str = "Version A",
+        project_name_b: str = "Version B",
+    ) -> ComparisonResult:
+        """
+        Compare two CLAUDE.md files, analyzing both concurrently.
+
+        Args:
+            claude_md_a: Path to first CLAUDE.md
+            claude_md_b: Path to second CLAUDE.md
+            project_name_a: Name for first version
+            project_name_b: Name for second version
+
+        Returns:
+            Comparison result with winner and detailed analysis
+        """
+        logger.info("\nComparing:")
+        logger.info(f"  A: {claude_md_a}")
+        logger.info(f"  B: {claude_md_b}")
+
+        # Analyze both at once - the work is dominated by waiting on Ollama
+        analysis_a, analysis_b = await asyncio.gather(
+            self.aanalyze(claude_md_a, project_name_a),
+            self.aanalyze(claude_md_b, project_name_b),
+        )
+
+        return self._build_comparison(
+            claude_md_a, claude_md_b, project_name_a, project_name_b, analysis_a, analysis_b
+        )
+
     def compare(
         self,
         claude_md_a: Path,
@@ -127,6 +384,9 @@ class ClaudeMDAnalyzer:
         """
         Compare two CLAUDE.md files.
 
+        Both files are analyzed concurrently in worker threads, so this is safe
+        to call from code that already runs an event loop.
+
         Args:
             claude_md_a: Path to first CLAUDE.md
             claude_md_b: Path to second CLAUDE.md
@@ -140,10 +400,25 @@ class ClaudeMDAnalyzer:
         logger.info(f"  A: {claude_md_a}")
         logger.info(f"  B: {claude_md_b}")
 
-        # Analyze both
-        analysis_a = self.analyze(claude_md_a, project_name_a)
-        analysis_b = self.analyze(claude_md_b, project_name_b)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            future_a = pool.submit(self.analyze, claude_md_a, project_name_a)
+            future_b = pool.submit(self.analyze, claude_md_b, project_name_b)
+            analysis_a, analysis_b = future_a.result(), future_b.result()
+
+        return self._build_comparison(
+            claude_md_a, claude_md_b, project_name_a, project_name_b, analysis_a, analysis_b
+        )
 
+    def _build_comparison(
+        self,
+        claude_md_a: Path,
+        claude_md_b: Path,
+        project_name_a: str,
+        project_name_b: str,
+        analysis_a: AnalysisResult,
+        analysis_b: AnalysisResult,
+    ) -> ComparisonResult:
+        """Pick the winner of two finished analyses and package the comparison."""
         # Determine winner
         score_a = analysis_a.score
         score_b = analysis_b.score
@@ -175,157 +450,56 @@ class ClaudeMDAnalyzer:
 
     def _result_to_dict(self, result: AnalysisResult) -> dict[str, Any]:
         """Convert AnalysisResult to dictionary."""
-        return {
-            "score": result.score,
-            "file_size": result.file_size,
-            "dimension_scores": result.dimension_scores,
-            "strengths": result.strengths,
-            "weaknesses": result.weaknesses,
-            "recommendations": result.recommendations,
-            "detailed_analysis": result.detailed_analysis,
-            "error": result.error,
-        }
+        return asdict(result)
 
     def _get_system_prompt(self) -> str:
         """Get system prompt for analysis."""
-        return """You are an expert at evaluating CLAUDE.md files for AI coding assistants.
-
-A good CLAUDE.md file should:
-1. **Be Clear & Specific**: Explicit commands, patterns, and examples
-2. **Cover Key Areas**: Testing, quality checks, architecture, common pitfalls
-3. **Be Actionable**: Concrete instructions, not vague guidelines
-4. **Include Standards**: TDD workflow, type safety, code quality requirements
-5. **Provide Context**: Project structure, common commands, troubleshooting
-
-Evaluate files on these dimensions and provide constructive feedback."""
+        return self._SYSTEM_PROMPT
 
     def _build_analysis_prompt(self, content: str, project_name: str) -> str:
         """Build analysis prompt."""
         char_count = len(content)
-        line_count = len(content.split("\n"))
+        line_count = content.count("\n") + 1
 
         # Limit content to avoid context window issues
         max_content_chars = 4000
         truncated_content = content[:max_content_chars]
-        if len(content) > max_content_chars:
+        if char_count > max_content_chars:
             truncated_content += (
                 f"\n\n[... truncated, {char_count - max_content_chars} more chars ...]"
             )
 
-        return f"""# CLAUDE.md File Analysis
-
-## Project Context
-**Project**: {project_name}
-**File Size**: {char_count} characters, {line_count} lines
-
-## File Content
-```markdown
-{truncated_content}
-```
-
-## Your Task
-
-Analyze this CLAUDE.md file and provide scores (0-100) for:
-
-1. **Clarity** (0-100): Are instructions clear and specific?
-2. **Completeness** (0-100): Covers all essential areas?
-3. **Actionability** (0-100): Provides concrete, executable guidance?
-4. **Standards** (0-100): Enforces quality standards (TDD, types, testing)?
-5. **Context** (0-100): Adequate project context and structure?
-
-Then provide:
-- **Overall Score** (0-100): Weighted average
-- **Strengths**: What this file does well (3-5 points)
-- **Weaknesses**: What could be improved (3-5 points)
-- **Recommendations**: Specific improvements (3-5 points)
-
-Format your response as:
-
-CLARITY: <score 0-100>
-COMPLETENESS: <score 0-100>
-ACTIONABILITY: <score 0-100>
-STANDARDS: <score 0-100>
-CONTEXT: <score 0-100>
-OVERALL: <score 0-100>
-
-STRENGTHS:
-- <strength 1>
-- <strength 2>
-- <strength 3>
-
-WEAKNESSES:
-- <weakness 1>
-- <weakness 2>
-- <weakness 3>
-
-RECOMMENDATIONS:
-- <recommendation 1>
-- <recommendation 2>
-- <recommendation 3>
-
-DETAILED_ANALYSIS:
-<Your detailed analysis here>
-"""
+        return self._ANALYSIS_TEMPLATE.format(
+            project_name=project_name,
+            char_count=char_count,
+            line_count=line_count,
+            truncated_content=truncated_content,
+        )
 
     def _parse_analysis(self, response: str, file_size: int) -> AnalysisResult:
         """Parse LLM analysis response."""
         scores: dict[str, float] = {}
-        strengths: list[str] = []
-        weaknesses: list[str] = []
-        recommendations: list[str] = []
-        detailed_analysis = ""
-
-        # Extract scores - handle multiple formats
-        for line in response.split("\n"):
-            for metric in [
-                "CLARITY",
-                "COMPLETENESS",
-                "ACTIONABILITY",
-                "STANDARDS",
-                "CONTEXT",
-                "OVERALL",
-            ]:
-                line_upper = line.upper()
-                if metric in line_upper:
-                    try:
-                        # Remove markdown formatting
-                        clean_line = line.replace("**", "").replace("###", "").strip()
-
-                        # Try format: "CLARITY: 90"
-                        if ":" in clean_line:
-                            score_part = clean_line.split(":")[-1].strip()
-                            score_str = score_part.split()[0]  # Get first number
-                            scores[metric.lower()] = float(score_str)
-                        # Try format: "Clarity (90/100)"
-                        elif "(" in clean_line and "/" in clean_line:
-                            score_part = clean_line.split("(")[1].split("/")[0]
-                            scores[metric.lower()] = float(score_part)
-                    except (ValueError, IndexError):
-                        pass
+
+        # Extract scores - handle multiple formats, later lines win
+        for match in self._SCORE_RE.finditer(response):
+            scores[match["metric"].lower()] = float(match["colon"] or match["paren"])
 
         # Extract bullet lists
-        strengths = self._extract_bullets(response, "STRENGTHS")
-        weaknesses = self._extract_bullets(response, "WEAKNESSES")
-        recommendations = self._extract_bullets(response, "RECOMMENDATIONS")
+        bullets = self._extract_bullets(response)
+        strengths = bullets.get("strengths", [])
+        weaknesses = bullets.get("weaknesses", [])
+        recommendations = bullets.get("recommendations", [])
 
         # Extract detailed analysis
-        if "DETAILED_ANALYSIS:" in response:
-            parts = response.split("DETAILED_ANALYSIS:")
-            if len(parts) > 1:
-                detailed_analysis = parts[1].strip()
+        detailed_analysis = response.partition("DETAILED_ANALYSIS:")[2].strip()
 
         # Calculate overall score if not provided
         overall_score = scores.get("overall", 0.0)
-        if overall_score == 0.0 and scores:
+        if overall_score == 0.0:
             # Calculate average of dimension scores
-            dimension_sum = 0.0
-            dimension_count = 0
-            for key, value in scores.items():
-                if key != "overall":
-                    dimension_sum += value
-                    dimension_count += 1
-            if dimension_count > 0:
-                overall_score = dimension_sum / dimension_count
+            dimension_scores = [value for key, value in scores.items() if key != "overall"]
+            if dimension_scores:
+                overall_score = sum(dimension_scores) / len(dimension_scores)
 
         return AnalysisResult(
             score=overall_score,
@@ -337,18 +511,13 @@ DETAILED_ANALYSIS:
             detailed_analysis=detailed_analysis or response[:1000],
         )
 
-    def _extract_bullets(self, text: str, section: str) -> list[str]:
-        """Extract bullet list from section."""
-        items: list[str] = []
-        in_section = False
-
-        for line in text.split("\n"):
-            if f"{section}:" in line:
-                in_section = True
-                continue
-            elif in_section and line.strip().startswith("-"):
-                items.append(line.strip("- ").strip())
-            elif in_section and line.strip() and not line.strip().startswith("-"):
-                break
-
-        return items[:5]  # Limit to 5
+    def _extract_bullets(self, text: str) -> dict[str, list[str]]:
+        """Extract the bullet list of every section, keyed by lowercase section name."""
+        sections: dict[str, list[str]] = {}
+
+        # The first block for each section wins, as later ones are usually prose
+        for match in self._SECTIONS_RE.finditer(text):
+            items = [item for line in match["block"].splitlines() if (item := line.strip(" \t\r-"))]
+            sections.setdefault(match["section"].lower(), items[:5])  # Limit to 5
+
+        return sections
@@ -0,0 +1,136 @@
+"""
+Analysis Cache
+
+Persistent cache of LLM analysis results, so re-auditing an unchanged CLAUDE.md
+does not repeat the Ollama call.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+from claude_md_bench import _json
+
+logger = logging.getLogger(__name__)
+
+# Bump when prompt building or response parsing changes so stale entries miss
+CACHE_VERSION = 1
+DEFAULT_MAX_ENTRIES = 500
+
+
+class AnalysisCache:
+    """SQLite-backed LRU cache of analysis results keyed by model and prompt."""
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        """
+        Initialize cache. The database is created lazily on first use.
+
+        Args:
+            path: SQLite database file. Defaults to ~/.claude-md-bench/cache/analysis.db
+            max_entries: Number of entries kept before least recently used ones are evicted
+        """
+        if path is None:
+            path = Path.home() / ".claude-md-bench" / "cache" / "analysis.db"
+
+        self.path = path
+        self.max_entries = max_entries
+
+    @staticmethod
+    def make_key(model: str, system: str, prompt: str) -> str:
+        """
+        Build the cache key for an analysis request.
+
+        The prompt embeds the file content and project name, so any change to
+        either produces a different key.
+
+        Args:
+            model: Ollama model name
+            system: System prompt
+            prompt: User prompt
+
+        Returns:
+            Hex digest identifying the request
+        """
+        digest = hashlib.sha256()
+        for part in (str(CACHE_VERSION), str(model), system, prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Cached result fields, or None on a miss or if the cache is unusable
+        """
+        try:
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute("SELECT payload FROM analyses WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE analyses SET last_used = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Analysis cache unavailable: {e}")
+            return None
+
+        try:
+            payload = _json.loads(row[0])
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Ignoring corrupt analysis cache entry: {e}")
+            return None
+        if not isinstance(payload, dict):
+            logger.warning("Ignoring corrupt analysis cache entry: not an object")
+            return None
+
+        logger.debug(f"Analysis cache hit: {key[:12]}")
+        return payload
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Store a result, evicting the least recently used entries over the cap.
+
+        Args:
+            key: Key from make_key()
+            value: Result to store, as a dict or dataclass of JSON serializable
+                fields; get() returns it as a dict
+        """
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO analyses (key, payload, last_used) VALUES (?, ?, ?)",
+                    (key, _json.dumps(value), time.time()),
+                )
+                conn.execute(
+                    "DELETE FROM analyses WHERE key NOT IN "
+                    "(SELECT key FROM analyses ORDER BY last_used DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Could not write analysis cache: {e}")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the database on first use."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS analyses "
+            "(key TEXT PRIMARY KEY, payload TEXT NOT NULL, last_used REAL NOT NULL)"
+        )
+        return conn
@@ -7,7 +7,10 @@ Inspired by Arize prompt learning research.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -17,7 +20,7 @@ from claude_md_bench.llm.ollama import OllamaClient
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class OptimizationIteration:
     """Result of a single optimization iteration."""
 
@@ -29,7 +32,7 @@ class OptimizationIteration:
     analysis: AnalysisResult
 
 
-@dataclass
+@dataclass(slots=True)
 class OptimizationResult:
     """Result of the full optimization process."""
 
@@ -45,6 +48,155 @@ class OptimizationResult:
 class MetaPrompter:
     """Generates improved CLAUDE.md using meta-prompting."""
 
+    _MARKER_RE = re.compile(r"<<<BEGIN_CLAUDE_MD>>>(.*?)<<<END_CLAUDE_MD>>>", re.DOTALL)
+
+    # Meta-text lines skipped by the last-resort extraction strategy
+    _SKIP_RE = re.compile(
+        "|".join(
+            re.escape(pattern)
+            for pattern in (
+                "# CLAUDE.md Improvement Task",
+                "## Current CLAUDE.md",
+                "## Current Performance",
+                "## Issues Identified",
+                "## Your Task",
+                "I can help",
+                "Here is a revised version",
+                "Here's the improved version",
+                "Based on the provided",
+                "**Improvement Plan**",
+            )
+        ),
+        re.IGNORECASE,
+    )
+
+    _SYSTEM_PROMPT = """You are an expert at optimizing CLAUDE.md files for AI coding assistants.
+
+CRITICAL OUTPUT RULES:
+- Output ONLY the complete, improved CLAUDE.md file content
+- Start your response with the marker: <<<BEGIN_CLAUDE_MD>>>
+- Then immediately output the CLAUDE.md content starting with "# CLAUDE.md"
+- End your response with the marker: <<<END_CLAUDE_MD>>>
+- Do NOT include any explanations, commentary, or meta-text outside the markers
+- Do NOT say "Here's the improved version" or similar phrases
+- Output the raw markdown file ready to save between the markers
+
+Your task: Improve the CLAUDE.md file by:
+1. Preserving all working guidance (keep what's good)
+2. Strengthening areas that scored poorly in the evaluation
+3. Adding concrete examples where needed
+4. Maintaining the original structure and organization
+5. Keeping it actionable and specific
+
+EXAMPLE OUTPUT FORMAT:
+<<<BEGIN_CLAUDE_MD>>>
+# CLAUDE.md
+
+## Project Overview
+[Your improved content here]
+<<<END_CLAUDE_MD>>>"""
+
+    _FUSED_SYSTEM_PROMPT = """You are an expert at evaluating and optimizing CLAUDE.md files for AI coding assistants.
+
+First evaluate the file, then rewrite it to fix what the evaluation found.
+
+CRITICAL OUTPUT RULES:
+- Start with the evaluation in exactly the requested score format
+- Then output the marker: <<<BEGIN_CLAUDE_MD>>>
+- Then the complete, improved CLAUDE.md content starting with "# CLAUDE.md"
+- End your response with the marker: <<<END_CLAUDE_MD>>>
+- Do NOT include commentary after the evaluation or outside the markers"""
+
+    # Prompt templates, filled with str.format on each call. The instructions
+    # come first and never vary, so the server can reuse their cached prefix
+    # across iterations; everything iteration-specific sits at the end.
+    _META_TEMPLATE = """# CLAUDE.md Improvement Task
+
+## Your Task
+
+Improve the CLAUDE.md file below to address the weaknesses and recommendations listed after it.
+
+**Focus Areas** (prioritize low-scoring dimensions):
+1. If Clarity is low: Make instructions more explicit and specific
+2. If Completeness is low: Add missing essential sections
+3. If Actionability is low: Add concrete examples and commands
+4. If Standards is low: Strengthen TDD, type safety, quality check requirements
+5. If Context is low: Add more project structure and architecture info
+
+**CRITICAL: Preservation Requirements**:
+- **PRESERVE ALL WORKING CONTENT**: Do NOT remove sections that aren't mentioned in weaknesses
+- **MAINTAIN OR INCREASE LENGTH**: Don't over-simplify
+- **KEEP ALL SECTIONS**: Preserve existing structure
+- **ADD, DON'T REPLACE**: Strengthen weak areas by adding, not removing
+- **TARGET ADDITIONS**: Only modify sections related to identified weaknesses
+
+**Output Format**:
+Provide ONLY the improved CLAUDE.md content between the markers.
+Do not include explanations or commentary.
+
+## Current CLAUDE.md (Iteration {iteration})
+```markdown
+{truncated}
+```{truncated_notice}
+
+## Current Performance
+**Overall Score**: {score:.1f}/100
+
+**Dimension Scores**:
+{dim_scores_text}
+
+## Issues Identified
+
+**Weaknesses**:
+{weaknesses_text}
+
+**Recommendations**:
+{recommendations_text}
+"""
+
+    _FUSED_TEMPLATE = """# CLAUDE.md Evaluation and Improvement
+
+## Step 1: Evaluate
+
+Score the CLAUDE.md file below (0-100) on Clarity, Completeness, Actionability,
+Standards (TDD, types, testing) and Context, then list strengths, weaknesses and
+recommendations. Use exactly this format:
+
+CLARITY: <score 0-100>
+COMPLETENESS: <score 0-100>
+ACTIONABILITY: <score 0-100>
+STANDARDS: <score 0-100>
+CONTEXT: <score 0-100>
+OVERALL: <score 0-100>
+
+STRENGTHS:
+- <strength>
+
+WEAKNESSES:
+- <weakness>
+
+RECOMMENDATIONS:
+- <recommendation>
+
+## Step 2: Improve
+
+Rewrite the file to address the weaknesses and recommendations from Step 1,
+prioritizing the lowest-scoring dimensions.
+
+**CRITICAL: Preservation Requirements**:
+- **PRESERVE ALL WORKING CONTENT**: Do NOT remove sections that aren't mentioned in weaknesses
+- **MAINTAIN OR INCREASE LENGTH**: Don't over-simplify
+- **ADD, DON'T REPLACE**: Strengthen weak areas by adding, not removing
+
+**Output Format**:
+The evaluation, then the improved CLAUDE.md content between the markers.
+
+## Current CLAUDE.md (Iteration {iteration})
+```markdown
+{truncated}
+```{truncated_notice}
+"""
+
     def __init__(self, ollama_client: OllamaClient) -> None:
         """
         Initialize meta-prompter.
@@ -90,33 +242,53 @@ class MetaPrompter:
             logger.error(f"Meta-prompting failed: {e}")
             raise
 
+    def analyze_and_improve(self, current_content: str, iteration: int = 1) -> tuple[str, str]:
+        """
+        Evaluate CLAUDE.md and generate an improved version in a single call.
+
+        Args:
+            current_content: Current CLAUDE.md content
+            iteration: Iteration number of the version being generated
+
+        Returns:
+            Tuple of (evaluation text in the analyzer's response format,
+            improved CLAUDE.md content)
+        """
+        logger.info(f"Evaluating and improving CLAUDE.md in one call (iteration {iteration})")
+
+        raw_output = self.ollama.generate(
+            prompt=self._build_fused_prompt(current_content, iteration),
+            system=self._get_fused_system_prompt(),
+            temperature=0.5,
+        )
+
+        evaluation, marker, _ = raw_output.partition("<<<BEGIN_CLAUDE_MD>>>")
+        improved_md = self._extract_clean_claude_md(raw_output)
+        logger.info(f"Generated improved CLAUDE.md ({len(improved_md)} chars)")
+        return (evaluation if marker else raw_output), improved_md
+
     def _get_system_prompt(self) -> str:
         """Get system prompt for meta-prompting."""
-        return """You are an expert at optimizing CLAUDE.md files for AI coding assistants.
-
-CRITICAL OUTPUT RULES:
-- Output ONLY the complete, improved CLAUDE.md file content
-- Start your response with the marker: <<<BEGIN_CLAUDE_MD>>>
-- Then immediately output the CLAUDE.md content starting with "# CLAUDE.md"
-- End your response with the marker: <<<END_CLAUDE_MD>>>
-- Do NOT include any explanations, commentary, or meta-text outside the markers
-- Do NOT say "Here's the improved version" or similar phrases
-- Output the raw markdown file ready to save between the markers
+        return self._SYSTEM_PROMPT
 
-Your task: Improve the CLAUDE.md file by:
-1. Preserving all working guidance (keep what's good)
-2. Strengthening areas that scored poorly in the evaluation
-3. Adding concrete examples where needed
-4. Maintaining the original structure and organization
-5. Keeping it actionable and specific
+    def _get_fused_system_prompt(self) -> str:
+        """Get system prompt for combined evaluation and improvement."""
+        return self._FUSED_SYSTEM_PROMPT
 
-EXAMPLE OUTPUT FORMAT:
-<<<BEGIN_CLAUDE_MD>>>
-# CLAUDE.md
+    def _build_fused_prompt(self, content: str, iteration: int) -> str:
+        """Build prompt asking for an evaluation followed by an improved version."""
+        max_chars = 15000
+        char_count = len(content)
+        truncated = content[:max_chars]
+        truncated_notice = ""
+        if char_count > max_chars:
+            truncated_notice = f"\n\n[Note: Full file is {char_count} chars. Showing first {max_chars} for context.]\n"
 
-## Project Overview
-[Your improved content here]
-<<<END_CLAUDE_MD>>>"""
+        return self._FUSED_TEMPLATE.format(
+            iteration=iteration,
+            truncated=truncated,
+            truncated_notice=truncated_notice,
+        )
 
     def _build_meta_prompt(
         self,
@@ -140,56 +312,24 @@ EXAMPLE OUTPUT FORMAT:
 
         # Truncate if too long
         max_chars = 15000
+        char_count = len(content)
         truncated = content[:max_chars]
         truncated_notice = ""
-        if len(content) > max_chars:
-            truncated_notice = f"\n\n[Note: Full file is {len(content)} chars. Showing first {max_chars} for context.]\n"
-
-        return f"""# CLAUDE.md Improvement Task (Iteration {iteration})
-
-## Current CLAUDE.md
-```markdown
-{truncated}
-```{truncated_notice}
-
-## Current Performance
-**Overall Score**: {analysis.score:.1f}/100
-
-**Dimension Scores**:
-{dim_scores_text if dim_scores_text else "  No dimension scores available"}
-
-## Issues Identified
-
-**Weaknesses**:
-{weaknesses_text if weaknesses_text else "  No specific weaknesses identified"}
-
-**Recommendations**:
-{recommendations_text if recommendations_text else "  No specific recommendations"}
-
-## Your Task
-
-Improve this CLAUDE.md file to address the weaknesses and recommendations above.
-
-**Focus Areas** (prioritize low-scoring dimensions):
-1. If Clarity is low: Make instructions more explicit and specific
-2. If Completeness is low: Add missing essential sections
-3. If Actionability is low: Add concrete examples and commands
-4. If Standards is low: Strengthen TDD, type safety, quality check requirements
-5. If Context is low: Add more project structure and architecture info
-
-**CRITICAL: Preservation Requirements**:
-- **PRESERVE ALL WORKING CONTENT**: Do NOT remove sections that aren't mentioned in weaknesses
-- **MAINTAIN OR INCREASE LENGTH**: Don't over-simplify
-- **KEEP ALL SECTIONS**: Preserve existing structure
-- **ADD, DON'T REPLACE**: Strengthen weak areas by adding, not removing
-- **TARGET ADDITIONS**: Only modify sections related to identified weaknesses
-
-**Output Format**:
-Provide ONLY the improved CLAUDE.md content between the markers.
-Do not include explanations or commentary.
-"""
+        if char_count > max_chars:
+            truncated_notice = f"\n\n[Note: Full file is {char_count} chars. Showing first {max_chars} for context.]\n"
+
+        return self._META_TEMPLATE.format(
+            iteration=iteration,
+            truncated=truncated,
+            truncated_notice=truncated_notice,
+            score=analysis.score,
+            dim_scores_text=dim_scores_text or "  No dimension scores available",
+            weaknesses_text=weaknesses_text or "  No specific weaknesses identified",
+            recommendations_text=recommendations_text or "  No specific recommendations",
+        )
 
-    def _extract_clean_claude_md(self, raw_output: str) -> str:
+    @classmethod
+    def _extract_clean_claude_md(cls, raw_output: str) -> str:
         """
         Extract clean CLAUDE.md content from LLM output.
 
@@ -200,15 +340,10 @@ Do not include explanations or commentary.
             Clean CLAUDE.md content
         """
         # Strategy 1: Extract between markers
-        begin_marker = "<<<BEGIN_CLAUDE_MD>>>"
-        end_marker = "<<<END_CLAUDE_MD>>>"
-
-        if begin_marker in raw_output and end_marker in raw_output:
-            start_idx = raw_output.index(begin_marker) + len(begin_marker)
-            end_idx = raw_output.index(end_marker)
-            content = raw_output[start_idx:end_idx].strip()
+        match = cls._MARKER_RE.search(raw_output)
+        if match:
             logger.debug("Extracted CLAUDE.md using markers")
-            return content
+            return match.group(1).strip()
 
         # Strategy 2: Find markdown header patterns
         patterns = [
@@ -218,41 +353,25 @@ Do not include explanations or commentary.
             "# Development",
         ]
 
+        # Patterns are tried in priority order, not by position in the output
         for pattern in patterns:
-            if pattern in raw_output:
-                idx = raw_output.index(pattern)
+            idx = raw_output.find(pattern)
+            if idx != -1:
                 content = raw_output[idx:].strip()
                 logger.warning(f"Extracted CLAUDE.md using pattern: {pattern.strip()}")
                 return content
 
         # Strategy 3: Remove meta-text patterns
         lines = raw_output.split("\n")
-        skip_patterns = [
-            "# CLAUDE.md Improvement Task",
-            "## Current CLAUDE.md",
-            "## Current Performance",
-            "## Issues Identified",
-            "## Your Task",
-            "I can help",
-            "Here is a revised version",
-            "Here's the improved version",
-            "Based on the provided",
-            "**Improvement Plan**",
-        ]
 
         start_line_idx = 0
         for i, line in enumerate(lines):
             line_stripped = line.strip()
 
-            if not line_stripped:
+            if not line_stripped or cls._SKIP_RE.search(line_stripped):
                 continue
 
-            if any(skip.lower() in line.lower() for skip in skip_patterns):
-                continue
-
-            if line_stripped.startswith("#") and not any(
-                skip.lower() in line.lower() for skip in skip_patterns
-            ):
+            if line_stripped.startswith("#"):
                 start_line_idx = i
                 break
 
@@ -279,12 +398,19 @@ class ClaudeMDOptimizer:
         self.ollama = ollama_client
         self.analyzer = ClaudeMDAnalyzer(ollama_client)
         self.meta_prompter = MetaPrompter(ollama_client)
+        # Analyses by content digest, so a rewrite identical to an earlier
+        # version (e.g. the model echoing its input) is not re-scored
+        self._analyses: dict[bytes, AnalysisResult] = {}
 
     def optimize(
         self,
         claude_md_path: Path,
         iterations: int = 3,
         output_path: Path | None = None,
+        parallel_candidates: int = 1,
+        speculative: bool = False,
+        fused: bool = False,
+        keep_history: bool = True,
     ) -> OptimizationResult:
         """
         Run optimization loop to improve CLAUDE.md.
@@ -293,10 +419,30 @@ class ClaudeMDOptimizer:
             claude_md_path: Path to CLAUDE.md file
             iterations: Number of optimization iterations
             output_path: Path to save optimized file (default: alongside original)
+            parallel_candidates: Rewrite candidates generated and scored concurrently
+                per iteration; the best-scoring one is kept. 1 runs sequentially.
+            speculative: Start the next iteration's rewrite while the current one is
+                being scored, using the previous feedback. The rewrite is kept if the
+                weakest dimension did not change, otherwise it is redone.
+            fused: Evaluate each version and draft its successor in one Ollama call,
+                so N iterations take N+1 calls instead of 2N+1. Only the final
+                version is scored with the standalone analysis prompt.
+            keep_history: Keep every iteration's content in result.iterations. When
+                False only scores and analyses are kept there; the best version is
+                still available as result.final_content.
 
         Returns:
             OptimizationResult with all iterations and final content
+
+        Raises:
+            ValueError: If parallel_candidates is less than 1, or if more than one of
+                parallel_candidates > 1, speculative and fused is requested
         """
+        if parallel_candidates < 1:
+            raise ValueError("parallel_candidates must be at least 1")
+        if sum((parallel_candidates > 1, speculative, fused)) > 1:
+            raise ValueError("parallel candidates, speculative and fused modes are exclusive")
+
         logger.info(f"Starting optimization of {claude_md_path} ({iterations} iterations)")
 
         # Read original content
@@ -305,8 +451,19 @@ class ClaudeMDOptimizer:
 
         # Initial evaluation
         logger.info("Evaluating baseline CLAUDE.md...")
-        baseline_analysis = self.analyzer.analyze(claude_md_path, project_name)
+        # Speculative or fused rewrite to use as the next iteration's candidate
+        pending: str | None = None
+        if fused:
+            baseline_analysis, pending = self._analyze_and_improve(
+                claude_md_path, original_content, 1
+            )
+        else:
+            # Only scores and feedback feed the meta-prompt, so skip the detailed tail
+            baseline_analysis = self.analyzer.analyze_content(
+                original_content, project_name, include_details=False
+            )
         original_score = baseline_analysis.score
+        self._remember(original_content, baseline_analysis)
 
         logger.info(f"Baseline score: {original_score:.1f}/100")
 
@@ -323,23 +480,58 @@ class ClaudeMDOptimizer:
         current_score = original_score
         current_analysis = baseline_analysis
 
+        # Best version across iterations, tracked as the loop goes
+        best_score: float | None = None
+        best_content = original_content
+
         # Optimization loop
         for i in range(1, iterations + 1):
             logger.info(f"\n--- Iteration {i}/{iterations} ---")
 
-            # Generate improved version
-            improved_content = self.meta_prompter.improve(
-                current_content=current_content,
-                analysis=current_analysis,
-                iteration=i,
-            )
-
-            # Save to temp file for analysis
-            temp_path = claude_md_path.parent / f".claude_md_temp_iter_{i}.md"
-            temp_path.write_text(improved_content, encoding="utf-8")
-
-            # Evaluate improved version
-            improved_analysis = self.analyzer.analyze(temp_path, f"{project_name} (iter {i})")
+            # Generate and evaluate improved version(s)
+            if parallel_candidates > 1:
+                improved_content, improved_analysis = asyncio.run(
+                    self._abest_candidate(
+                        claude_md_path,
+                        current_content,
+                        current_analysis,
+                        i,
+                        parallel_candidates,
+                    )
+                )
+            elif fused:
+                improved_content = pending or current_content
+                if i < iterations:
+                    improved_analysis, pending = self._analyze_and_improve(
+                        claude_md_path, improved_content, i + 1
+                    )
+                else:
+                    improved_analysis = self._score(claude_md_path, improved_content, i)
+            elif speculative:
+                improved_content = pending or self.meta_prompter.improve(
+                    current_content=current_content,
+                    analysis=current_analysis,
+                    iteration=i,
+                )
+                pending = None
+
+                if i < iterations:
+                    improved_analysis, next_content = asyncio.run(
+                        self._ascore_and_speculate(
+                            claude_md_path, improved_content, current_analysis, i
+                        )
+                    )
+                    seed = _weakest_dimension(current_analysis)
+                    if seed is not None and seed == _weakest_dimension(improved_analysis):
+                        pending = next_content
+                    else:
+                        logger.info(f"Iteration {i}: weakest dimension changed, redoing rewrite")
+                else:
+                    improved_analysis = self._score(claude_md_path, improved_content, i)
+            else:
+                improved_content, improved_analysis = self._improve_and_score(
+                    claude_md_path, current_content, current_analysis, i
+                )
             improved_score = improved_analysis.score
 
             # Calculate delta
@@ -355,24 +547,25 @@ class ClaudeMDOptimizer:
                 score=improved_score,
                 previous_score=current_score,
                 delta=delta,
-                content=improved_content,
+                content=improved_content if keep_history else "",
                 analysis=improved_analysis,
             )
             result.iterations.append(iteration_result)
 
+            if best_score is None or improved_score > best_score:
+                best_score = improved_score
+                best_content = improved_content
+
             # Update for next iteration (always use latest, even if score dropped)
             # This allows recovery from local minima
             current_content = improved_content
             current_score = improved_score
             current_analysis = improved_analysis
 
-            # Clean up temp file
-            temp_path.unlink(missing_ok=True)
-
-        # Determine best version (highest score across all iterations)
-        best_iteration = max(result.iterations, key=lambda x: x.score)
-        result.final_score = best_iteration.score
-        result.final_content = best_iteration.content
+        # Keep the best version (highest score across all iterations)
+        if best_score is not None:
+            result.final_score = best_score
+            result.final_content = best_content
         result.total_improvement = result.final_score - result.original_score
 
         # Save optimized file
@@ -389,3 +582,116 @@ class ClaudeMDOptimizer:
         logger.info(f"Saved to: {output_path}")
 
         return result
+
+    def _improve_and_score(
+        self,
+        claude_md_path: Path,
+        current_content: str,
+        current_analysis: AnalysisResult,
+        iteration: int,
+    ) -> tuple[str, AnalysisResult]:
+        """Generate one improved version and evaluate it."""
+        improved_content = self.meta_prompter.improve(
+            current_content=current_content,
+            analysis=current_analysis,
+            iteration=iteration,
+        )
+
+        return improved_content, self._score(claude_md_path, improved_content, iteration)
+
+    def _analyze_and_improve(
+        self,
+        claude_md_path: Path,
+        content: str,
+        iteration: int,
+    ) -> tuple[AnalysisResult, str]:
+        """Evaluate content and draft the next version with one fused call."""
+        evaluation, improved_content = self.meta_prompter.analyze_and_improve(content, iteration)
+        analysis = self.analyzer._parse_analysis(evaluation, len(content))
+        if not analysis.dimension_scores:
+            # The model skipped the score block; fall back to a standalone analysis
+            logger.warning(f"Iteration {iteration}: fused response had no scores, re-scoring")
+            analysis = self._score(claude_md_path, content, iteration - 1)
+        return analysis, improved_content
+
+    def _score(
+        self,
+        claude_md_path: Path,
+        content: str,
+        iteration: int,
+    ) -> AnalysisResult:
+        """Evaluate one version, reusing the analysis of identical earlier content."""
+        known = self._analyses.get(_content_key(content))
+        if known is not None:
+            logger.info(f"Iteration {iteration}: rewrite matches an earlier version, reusing score")
+            return known
+
+        analysis = self.analyzer.analyze_content(
+            content,
+            f"{claude_md_path.parent.name} (iter {iteration})",
+            include_details=False,
+        )
+
+        self._remember(content, analysis)
+        return analysis
+
+    async def _ascore_and_speculate(
+        self,
+        claude_md_path: Path,
+        content: str,
+        previous_analysis: AnalysisResult,
+        iteration: int,
+    ) -> tuple[AnalysisResult, str]:
+        """Score this iteration's content while rewriting it from the previous feedback."""
+        return await asyncio.gather(
+            asyncio.to_thread(self._score, claude_md_path, content, iteration),
+            asyncio.to_thread(
+                self.meta_prompter.improve,
+                current_content=content,
+                analysis=previous_analysis,
+                iteration=iteration + 1,
+            ),
+        )
+
+    def _remember(self, content: str, analysis: AnalysisResult) -> None:
+        """Record a successful analysis for reuse by later iterations."""
+        if analysis.dimension_scores and not analysis.error:
+            self._analyses[_content_key(content)] = analysis
+
+    async def _abest_candidate(
+        self,
+        claude_md_path: Path,
+        current_content: str,
+        current_analysis: AnalysisResult,
+        iteration: int,
+        candidates: int,
+    ) -> tuple[str, AnalysisResult]:
+        """Generate and evaluate several candidates concurrently, keeping the best."""
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self._improve_and_score,
+                    claude_md_path,
+                    current_content,
+                    current_analysis,
+                    iteration,
+                )
+                for _ in range(candidates)
+            )
+        )
+
+        scores = ", ".join(f"{analysis.score:.1f}" for _, analysis in results)
+        logger.info(f"Iteration {iteration} candidate scores: {scores}")
+
+        return max(results, key=lambda r: r[1].score)
+
+
+def _weakest_dimension(analysis: AnalysisResult) -> str | None:
+    """Name of the lowest-scoring dimension, or None if there are no scores."""
+    dimensions = {k: v for k, v in analysis.dimension_scores.items() if k != "overall"}
+    return min(dimensions, key=dimensions.__getitem__) if dimensions else None
+
+
+def _content_key(content: str) -> bytes:
+    """Digest identifying a CLAUDE.md version."""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
@@ -6,27 +6,49 @@ Generates text and HTML reports for CLAUDE.md comparisons and audits.
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from claude_md_bench._console import console
 from claude_md_bench.core.analyzer import AnalysisResult, ComparisonResult
 from claude_md_bench.core.reporting_constants import (
+    DIMENSION_LABELS,
+    DIMENSION_TITLES,
     DIMENSIONS,
+    DISPLAY_TIMESTAMP_FORMAT,
+    FILENAME_TIMESTAMP_FORMAT,
+    SECTION_RULE,
+    TITLE_RULE,
+    format_size,
     generate_comparison_filename,
     generate_report_filename,
     get_delta_style,
     get_score_style,
 )
 
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+    from jinja2.environment import TemplateStream
+
 logger = logging.getLogger(__name__)
 
+TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
+
+# (dimension, score A, score B, A minus B)
+DimensionRow = tuple[str, float, float, float]
+
+
+def _section_header(title: str) -> str:
+    """Return a ruled text report section header."""
+    return f"{SECTION_RULE}{title}\n{SECTION_RULE}\n"
+
 
 class Reporter:
     """Generates comparison reports in various formats."""
@@ -43,19 +65,27 @@ class Reporter:
 
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.console = Console()
-
-        # Setup Jinja2 for HTML templates
-        template_dir = Path(__file__).parent.parent / "templates"
-        self.jinja_env: Environment | None
-        if template_dir.exists():
-            self.jinja_env = Environment(
-                loader=FileSystemLoader(template_dir),
-                autoescape=select_autoescape(["html", "xml"]),
-            )
-        else:
-            self.jinja_env = None
-            logger.warning(f"Template directory not found: {template_dir}")
+        self.console = console
+        # Plain-text dimension tables skip Rich's table layout, e.g. for CI logs
+        self.plain = bool(os.environ.get("CLAUDE_MD_BENCH_PLAIN"))
+        self._rows_for: tuple[ComparisonResult, list[DimensionRow]] | None = None
+
+        # Jinja2 is only imported and set up once an HTML report is requested
+        self.has_templates = TEMPLATE_DIR.exists()
+        if not self.has_templates:
+            logger.warning(f"Template directory not found: {TEMPLATE_DIR}")
+
+    def _get_template(self, name: str) -> Template | None:
+        """Load an HTML report template, or None if it is unavailable."""
+        if not self.has_templates:
+            logger.warning("Cannot generate HTML report: templates not available")
+            return None
+
+        try:
+            return _jinja_env().get_template(name)
+        except Exception as e:
+            logger.error(f"Failed to load template {name}: {e}")
+            return None
 
     def print_comparison(self, result: ComparisonResult) -> None:
         """
@@ -64,94 +94,120 @@ class Reporter:
         Args:
             result: Comparison result to display
         """
-        # Header
-        self.console.print()
-        self.console.print(
-            Panel.fit(
-                "[bold cyan]CLAUDE.md Comparison Results[/bold cyan]",
-                border_style="cyan",
+        # Buffer every line and write the whole block to the terminal once
+        with self.console:
+            # Header
+            self.console.print()
+            self.console.print(
+                Panel.fit(
+                    "[bold cyan]CLAUDE.md Comparison Results[/bold cyan]",
+                    border_style="cyan",
+                )
             )
-        )
 
-        # Summary table
-        table = Table(show_header=True, header_style="bold")
-        table.add_column("Version", style="cyan")
-        table.add_column("Score", justify="right")
-        table.add_column("Size", justify="right")
-        table.add_column("Winner", justify="center")
+            # Summary table
+            table = Table(show_header=True, header_style="bold")
+            table.add_column("Version", style="cyan")
+            table.add_column("Score", justify="right")
+            table.add_column("Size", justify="right")
+            table.add_column("Winner", justify="center")
+
+            analysis_a = result.version_a["analysis"]
+            analysis_b = result.version_b["analysis"]
+
+            # Format scores with winner highlighting
+            score_a = (
+                f"[green]{analysis_a['score']:.1f}/100[/green]"
+                if result.winner == "A"
+                else f"{analysis_a['score']:.1f}/100"
+            )
+            score_b = (
+                f"[green]{analysis_b['score']:.1f}/100[/green]"
+                if result.winner == "B"
+                else f"{analysis_b['score']:.1f}/100"
+            )
 
-        analysis_a = result.version_a["analysis"]
-        analysis_b = result.version_b["analysis"]
+            table.add_row(
+                f"A: {result.version_a['name']}",
+                score_a,
+                f"{format_size(analysis_a['file_size'])} chars",
+                "🏆" if result.winner == "A" else "",
+            )
+            table.add_row(
+                f"B: {result.version_b['name']}",
+                score_b,
+                f"{format_size(analysis_b['file_size'])} chars",
+                "🏆" if result.winner == "B" else "",
+            )
 
-        # Format scores with winner highlighting
-        score_a = (
-            f"[green]{analysis_a['score']:.1f}/100[/green]"
-            if result.winner == "A"
-            else f"{analysis_a['score']:.1f}/100"
-        )
-        score_b = (
-            f"[green]{analysis_b['score']:.1f}/100[/green]"
-            if result.winner == "B"
-            else f"{analysis_b['score']:.1f}/100"
-        )
+            self.console.print(table)
 
-        table.add_row(
-            f"A: {result.version_a['name']}",
-            score_a,
-            f"{analysis_a['file_size']:,} chars",
-            "🏆" if result.winner == "A" else "",
-        )
-        table.add_row(
-            f"B: {result.version_b['name']}",
-            score_b,
-            f"{analysis_b['file_size']:,} chars",
-            "🏆" if result.winner == "B" else "",
-        )
+            # Winner announcement
+            if result.winner == "TIE":
+                self.console.print("\n[yellow] Result: TIE[/yellow]")
+            else:
+                self.console.print(
+                    f"\n[green] Winner: Version {result.winner}[/green] "
+                    f"(+{result.score_delta:.1f} points)"
+                )
 
-        self.console.print(table)
+            # Dimension scores
+            self._print_dimension_scores(self._dimension_rows(result))
 
-        # Winner announcement
-        if result.winner == "TIE":
-            self.console.print("\n[yellow] Result: TIE[/yellow]")
-        else:
-            self.console.print(
-                f"\n[green] Winner: Version {result.winner}[/green] "
-                f"(+{result.score_delta:.1f} points)"
-            )
+            # Strengths and weaknesses
+            self._print_analysis_details(result)
 
-        # Dimension scores
-        self._print_dimension_scores(analysis_a, analysis_b)
+    def _dimension_rows(self, result: ComparisonResult) -> list[DimensionRow]:
+        """
+        Look up each dimension's scores once per comparison.
 
-        # Strengths and weaknesses
-        self._print_analysis_details(result)
+        The console output and both saved reports of a comparison reuse the rows
+        built for the most recent result.
+
+        Args:
+            result: Comparison result to tabulate
+
+        Returns:
+            (dimension, score A, score B, A minus B) rows in DIMENSIONS order
+        """
+        if self._rows_for is not None and self._rows_for[0] is result:
+            return self._rows_for[1]
 
-    def _print_dimension_scores(
-        self,
-        analysis_a: dict[str, Any],
-        analysis_b: dict[str, Any],
-    ) -> None:
+        scores_a = result.version_a["analysis"].get("dimension_scores", {})
+        scores_b = result.version_b["analysis"].get("dimension_scores", {})
+        rows: list[DimensionRow] = []
+        for dim in DIMENSIONS:
+            score_a = scores_a.get(dim, 0.0)
+            score_b = scores_b.get(dim, 0.0)
+            rows.append((dim, score_a, score_b, score_a - score_b))
+
+        self._rows_for = (result, rows)
+        return rows
+
+    def _print_dimension_scores(self, rows: list[DimensionRow]) -> None:
         """Print dimension score comparison."""
         self.console.print("\n[bold]Dimension Scores[/bold]")
 
+        if self.plain:
+            lines = [f"{'Dimension':<15} {'A':>5}  {'B':>5}  {'Delta':>5}"]
+            for (_, score_a, score_b, delta), label in zip(rows, DIMENSION_LABELS, strict=True):
+                delta_str = f"+{delta:.0f}" if delta > 0 else f"{delta:.0f}"
+                lines.append(f"{label} {score_a:>5.0f}  {score_b:>5.0f}  {delta_str:>5}")
+            self.console.print("\n".join(lines), markup=False, highlight=False)
+            return
+
         table = Table(show_header=True, header_style="bold")
         table.add_column("Dimension", style="cyan")
         table.add_column("Version A", justify="right")
         table.add_column("Version B", justify="right")
         table.add_column("Delta", justify="right")
 
-        scores_a = analysis_a.get("dimension_scores", {})
-        scores_b = analysis_b.get("dimension_scores", {})
-
-        for dim in DIMENSIONS:
-            score_a = scores_a.get(dim, 0.0)
-            score_b = scores_b.get(dim, 0.0)
-            delta = score_a - score_b
-
+        for (_, score_a, score_b, delta), title in zip(rows, DIMENSION_TITLES, strict=True):
             delta_str = f"+{delta:.0f}" if delta > 0 else f"{delta:.0f}"
             delta_color = get_delta_style(delta)
 
             table.add_row(
-                dim.title(),
+                title,
                 f"{score_a:.0f}",
                 f"{score_b:.0f}",
                 f"[{delta_color}]{delta_str}[/]",
@@ -186,112 +242,109 @@ class Reporter:
         for w in analysis_b.get("weaknesses", []):
             self.console.print(f"  [yellow]✗[/yellow] {w}")
 
-    def save_text_report(self, result: ComparisonResult) -> Path:
+    def save_text_report(self, result: ComparisonResult, timestamp: datetime | None = None) -> Path:
         """
         Save comparison as text report.
 
         Args:
             result: Comparison result to save
+            timestamp: When the result was produced. Defaults to now
 
         Returns:
             Path to saved report
         """
+        generated_at = timestamp or datetime.now()
         filename = generate_comparison_filename(
             "comparison",
             result.version_a["name"],
             result.version_b["name"],
             "txt",
+            generated_at.strftime(FILENAME_TIMESTAMP_FORMAT),
         )
         report_path = self.output_dir / filename
 
         analysis_a = result.version_a["analysis"]
         analysis_b = result.version_b["analysis"]
 
-        with open(report_path, "w", encoding="utf-8") as f:
-            f.write("CLAUDE.md Comparison Report\n")
-            f.write("=" * 70 + "\n\n")
-            f.write(f"Generated: {datetime.now().isoformat()}\n\n")
+        parts: list[str] = []
+        parts.append("CLAUDE.md Comparison Report\n")
+        parts.append(TITLE_RULE + "\n")
+        parts.append(f"Generated: {generated_at.isoformat()}\n\n")
 
-            f.write(f"Version A: {result.version_a['path']}\n")
-            f.write(f"Score: {analysis_a['score']:.1f}/100\n")
-            f.write(f"Size: {analysis_a['file_size']:,} chars\n\n")
+        parts.append(f"Version A: {result.version_a['path']}\n")
+        parts.append(f"Score: {analysis_a['score']:.1f}/100\n")
+        parts.append(f"Size: {format_size(analysis_a['file_size'])} chars\n\n")
 
-            f.write(f"Version B: {result.version_b['path']}\n")
-            f.write(f"Score: {analysis_b['score']:.1f}/100\n")
-            f.write(f"Size: {analysis_b['file_size']:,} chars\n\n")
+        parts.append(f"Version B: {result.version_b['path']}\n")
+        parts.append(f"Score: {analysis_b['score']:.1f}/100\n")
+        parts.append(f"Size: {format_size(analysis_b['file_size'])} chars\n\n")
 
-            f.write(f"Winner: Version {result.winner}\n")
-            if result.winner != "TIE":
-                f.write(f"Margin: {result.score_delta:.1f} points\n")
-            f.write("\n")
+        parts.append(f"Winner: Version {result.winner}\n")
+        if result.winner != "TIE":
+            parts.append(f"Margin: {result.score_delta:.1f} points\n")
+        parts.append("\n")
 
-            # Dimension scores
-            f.write("-" * 70 + "\n")
-            f.write("Dimension Scores\n")
-            f.write("-" * 70 + "\n\n")
+        # Dimension scores
+        parts.append(_section_header("Dimension Scores"))
 
-            scores_a = analysis_a.get("dimension_scores", {})
-            scores_b = analysis_b.get("dimension_scores", {})
+        for (_, score_a, score_b, _), label in zip(
+            self._dimension_rows(result), DIMENSION_LABELS, strict=True
+        ):
+            parts.append(f"{label} A: {score_a:.0f}  B: {score_b:.0f}\n")
 
-            for dim in DIMENSIONS:
-                f.write(
-                    f"{dim.title():<15} A: {scores_a.get(dim, 0):.0f}  B: {scores_b.get(dim, 0):.0f}\n"
-                )
+        parts.append("\n")
 
-            f.write("\n")
+        # Strengths and weaknesses
+        parts.append(_section_header("Analysis Details"))
 
-            # Strengths and weaknesses
-            f.write("-" * 70 + "\n")
-            f.write("Analysis Details\n")
-            f.write("-" * 70 + "\n\n")
+        parts.append("Version A Strengths:\n")
+        for s in analysis_a.get("strengths", []):
+            parts.append(f"  + {s}\n")
+        parts.append("\n")
 
-            f.write("Version A Strengths:\n")
-            for s in analysis_a.get("strengths", []):
-                f.write(f"  + {s}\n")
-            f.write("\n")
+        parts.append("Version A Weaknesses:\n")
+        for w in analysis_a.get("weaknesses", []):
+            parts.append(f"  - {w}\n")
+        parts.append("\n")
 
-            f.write("Version A Weaknesses:\n")
-            for w in analysis_a.get("weaknesses", []):
-                f.write(f"  - {w}\n")
-            f.write("\n")
+        parts.append("Version B Strengths:\n")
+        for s in analysis_b.get("strengths", []):
+            parts.append(f"  + {s}\n")
+        parts.append("\n")
 
-            f.write("Version B Strengths:\n")
-            for s in analysis_b.get("strengths", []):
-                f.write(f"  + {s}\n")
-            f.write("\n")
+        parts.append("Version B Weaknesses:\n")
+        for w in analysis_b.get("weaknesses", []):
+            parts.append(f"  - {w}\n")
 
-            f.write("Version B Weaknesses:\n")
-            for w in analysis_b.get("weaknesses", []):
-                f.write(f"  - {w}\n")
+        report_path.write_text("".join(parts), encoding="utf-8")
 
         logger.info(f"Text report saved to: {report_path}")
         return report_path
 
-    def save_html_report(self, result: ComparisonResult) -> Path | None:
+    def save_html_report(
+        self, result: ComparisonResult, timestamp: datetime | None = None
+    ) -> Path | None:
         """
         Save comparison as HTML report.
 
         Args:
             result: Comparison result to save
+            timestamp: When the result was produced. Defaults to now
 
         Returns:
             Path to saved report, or None if templates not available
         """
-        if self.jinja_env is None:
-            logger.warning("Cannot generate HTML report: templates not available")
-            return None
-
-        try:
-            template = self.jinja_env.get_template("comparison.html")
-        except Exception as e:
-            logger.error(f"Failed to load template: {e}")
+        template = self._get_template("comparison.html")
+        if template is None:
             return None
 
+        generated_at = timestamp or datetime.now()
         filename = generate_comparison_filename(
             "comparison",
             result.version_a["name"],
             result.version_b["name"],
             "html",
+            generated_at.strftime(FILENAME_TIMESTAMP_FORMAT),
         )
         report_path = self.output_dir / filename
 
@@ -299,29 +352,17 @@ class Reporter:
         analysis_b = result.version_b["analysis"]
 
         # Build dimension comparison data
-        dimensions_data: dict[str, dict[str, float]] = {}
-        scores_a = analysis_a.get("dimension_scores", {})
-        scores_b = analysis_b.get("dimension_scores", {})
-
-        for dim in DIMENSIONS:
-            dimensions_data[dim] = {
-                "a": scores_a.get(dim, 0.0),
-                "b": scores_b.get(dim, 0.0),
-            }
+        dimensions_data = {
+            dim: {"a": score_a, "b": score_b}
+            for dim, score_a, score_b, _ in self._dimension_rows(result)
+        }
 
         # Read file contents for drawer display
-        try:
-            content_a = Path(result.version_a["path"]).read_text(encoding="utf-8")
-        except Exception:
-            content_a = "Unable to read file content"
+        content_a = _read_file_content(Path(result.version_a["path"]))
+        content_b = _read_file_content(Path(result.version_b["path"]))
 
-        try:
-            content_b = Path(result.version_b["path"]).read_text(encoding="utf-8")
-        except Exception:
-            content_b = "Unable to read file content"
-
-        # Render template
-        html_content = template.render(
+        # Stream the rendered template to disk, chunk by chunk
+        stream = template.stream(
             version_a={
                 "name": result.version_a["name"],
                 "path": result.version_a["path"],
@@ -345,10 +386,10 @@ class Reporter:
             winner=result.winner,
             score_delta=result.score_delta,
             dimensions=dimensions_data,
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            timestamp=generated_at.strftime(DISPLAY_TIMESTAMP_FORMAT),
         )
 
-        report_path.write_text(html_content, encoding="utf-8")
+        _dump_stream(stream, report_path)
         logger.info(f"HTML report saved to: {report_path}")
         return report_path
 
@@ -362,154 +403,157 @@ class Reporter:
         """
         logger.info(f"Printing audit results for: {file_path}")
 
-        # Header
-        self.console.print()
-        self.console.print(
-            Panel.fit(
-                f"[bold cyan]CLAUDE.md Audit: {file_path.name}[/bold cyan]",
-                border_style="cyan",
+        # Buffer every line and write the whole block to the terminal once
+        with self.console:
+            # Header
+            self.console.print()
+            self.console.print(
+                Panel.fit(
+                    f"[bold cyan]CLAUDE.md Audit: {file_path.name}[/bold cyan]",
+                    border_style="cyan",
+                )
             )
-        )
-
-        # Overall score with color coding
-        score_color = get_score_style(result.score)
-        self.console.print(
-            f"\n[bold]Overall Score:[/bold] [{score_color}]{result.score:.1f}/100[/{score_color}]"
-        )
-        self.console.print(f"[dim]File size: {result.file_size:,} characters[/dim]")
 
-        # Dimension scores table
-        self.console.print("\n[bold]Dimension Scores[/bold]")
-        table = Table(show_header=True, header_style="bold")
-        table.add_column("Dimension", style="cyan")
-        table.add_column("Score", justify="right")
-
-        for dim in DIMENSIONS:
-            score = result.dimension_scores.get(dim, 0.0)
-            score_style = get_score_style(score)
-            table.add_row(dim.title(), f"[{score_style}]{score:.0f}[/{score_style}]")
+            # Overall score with color coding
+            score_color = get_score_style(result.score)
+            self.console.print(
+                f"\n[bold]Overall Score:[/bold] [{score_color}]{result.score:.1f}/100[/{score_color}]"
+            )
+            self.console.print(f"[dim]File size: {format_size(result.file_size)} characters[/dim]")
+
+            # Dimension scores table
+            self.console.print("\n[bold]Dimension Scores[/bold]")
+            if self.plain:
+                lines = [f"{'Dimension':<15} {'Score':>5}"]
+                lines.extend(
+                    f"{label} {result.dimension_scores.get(dim, 0.0):>5.0f}"
+                    for dim, label in zip(DIMENSIONS, DIMENSION_LABELS, strict=True)
+                )
+                self.console.print("\n".join(lines), markup=False, highlight=False)
+            else:
+                table = Table(show_header=True, header_style="bold")
+                table.add_column("Dimension", style="cyan")
+                table.add_column("Score", justify="right")
 
-        self.console.print(table)
+                for dim, title in zip(DIMENSIONS, DIMENSION_TITLES, strict=True):
+                    score = result.dimension_scores.get(dim, 0.0)
+                    score_style = get_score_style(score)
+                    table.add_row(title, f"[{score_style}]{score:.0f}[/{score_style}]")
 
-        # Strengths
-        if result.strengths:
-            self.console.print("\n[green]Strengths:[/green]")
-            for s in result.strengths:
-                self.console.print(f"  [green]✓[/green] {s}")
+                self.console.print(table)
 
-        # Weaknesses
-        if result.weaknesses:
-            self.console.print("\n[yellow]Weaknesses:[/yellow]")
-            for w in result.weaknesses:
-                self.console.print(f"  [yellow]✗[/yellow] {w}")
+            # Strengths
+            if result.strengths:
+                self.console.print("\n[green]Strengths:[/green]")
+                for s in result.strengths:
+                    self.console.print(f"  [green]✓[/green] {s}")
 
-        # Recommendations
-        if result.recommendations:
-            self.console.print("\n[cyan]Recommendations:[/cyan]")
-            for r in result.recommendations:
-                self.console.print(f"  [cyan]→[/cyan] {r}")
+            # Weaknesses
+            if result.weaknesses:
+                self.console.print("\n[yellow]Weaknesses:[/yellow]")
+                for w in result.weaknesses:
+                    self.console.print(f"  [yellow]✗[/yellow] {w}")
 
-    def save_audit_text_report(self, result: AnalysisResult, file_path: Path) -> Path:
+            # Recommendations
+            if result.recommendations:
+                self.console.print("\n[cyan]Recommendations:[/cyan]")
+                for r in result.recommendations:
+                    self.console.print(f"  [cyan]→[/cyan] {r}")
+
+    def save_audit_text_report(
+        self, result: AnalysisResult, file_path: Path, timestamp: datetime | None = None
+    ) -> Path:
         """
         Save audit results as text report.
 
         Args:
             result: Analysis result to save
             file_path: Path to the audited file
+            timestamp: When the result was produced. Defaults to now
 
         Returns:
             Path to saved report
         """
-        filename = generate_report_filename("audit", file_path.stem, "txt")
+        generated_at = timestamp or datetime.now()
+        file_stamp = generated_at.strftime(FILENAME_TIMESTAMP_FORMAT)
+        filename = generate_report_filename("audit", file_path.stem, "txt", file_stamp)
         report_path = self.output_dir / filename
 
-        with open(report_path, "w", encoding="utf-8") as f:
-            f.write("CLAUDE.md Audit Report\n")
-            f.write("=" * 70 + "\n\n")
-            f.write(f"Generated: {datetime.now().isoformat()}\n")
-            f.write(f"File: {file_path}\n")
-            f.write(f"Size: {result.file_size:,} characters\n\n")
+        parts: list[str] = []
+        parts.append("CLAUDE.md Audit Report\n")
+        parts.append(TITLE_RULE + "\n")
+        parts.append(f"Generated: {generated_at.isoformat()}\n")
+        parts.append(f"File: {file_path}\n")
+        parts.append(f"Size: {format_size(result.file_size)} characters\n\n")
 
-            f.write(f"Overall Score: {result.score:.1f}/100\n\n")
+        parts.append(f"Overall Score: {result.score:.1f}/100\n\n")
 
-            # Dimension scores
-            f.write("-" * 70 + "\n")
-            f.write("Dimension Scores\n")
-            f.write("-" * 70 + "\n\n")
+        # Dimension scores
+        parts.append(_section_header("Dimension Scores"))
 
-            for dim in DIMENSIONS:
-                score = result.dimension_scores.get(dim, 0.0)
-                f.write(f"{dim.title():<15} {score:.0f}/100\n")
+        for dim, label in zip(DIMENSIONS, DIMENSION_LABELS, strict=True):
+            score = result.dimension_scores.get(dim, 0.0)
+            parts.append(f"{label} {score:.0f}/100\n")
 
-            f.write("\n")
+        parts.append("\n")
 
-            # Strengths
-            f.write("-" * 70 + "\n")
-            f.write("Strengths\n")
-            f.write("-" * 70 + "\n\n")
-            for s in result.strengths:
-                f.write(f"  + {s}\n")
-            f.write("\n")
+        # Strengths
+        parts.append(_section_header("Strengths"))
+        for s in result.strengths:
+            parts.append(f"  + {s}\n")
+        parts.append("\n")
 
-            # Weaknesses
-            f.write("-" * 70 + "\n")
-            f.write("Weaknesses\n")
-            f.write("-" * 70 + "\n\n")
-            for w in result.weaknesses:
-                f.write(f"  - {w}\n")
-            f.write("\n")
+        # Weaknesses
+        parts.append(_section_header("Weaknesses"))
+        for w in result.weaknesses:
+            parts.append(f"  - {w}\n")
+        parts.append("\n")
 
-            # Recommendations
-            f.write("-" * 70 + "\n")
-            f.write("Recommendations\n")
-            f.write("-" * 70 + "\n\n")
-            for r in result.recommendations:
-                f.write(f"  * {r}\n")
-            f.write("\n")
-
-            # Detailed analysis
-            if result.detailed_analysis:
-                f.write("-" * 70 + "\n")
-                f.write("Detailed Analysis\n")
-                f.write("-" * 70 + "\n\n")
-                f.write(result.detailed_analysis)
-                f.write("\n")
+        # Recommendations
+        parts.append(_section_header("Recommendations"))
+        for r in result.recommendations:
+            parts.append(f"  * {r}\n")
+        parts.append("\n")
+
+        # Detailed analysis
+        if result.detailed_analysis:
+            parts.append(_section_header("Detailed Analysis"))
+            parts.append(result.detailed_analysis)
+            parts.append("\n")
+
+        report_path.write_text("".join(parts), encoding="utf-8")
 
         logger.info(f"Text report saved to: {report_path}")
         return report_path
 
-    def save_audit_html_report(self, result: AnalysisResult, file_path: Path) -> Path | None:
+    def save_audit_html_report(
+        self, result: AnalysisResult, file_path: Path, timestamp: datetime | None = None
+    ) -> Path | None:
         """
         Save audit results as HTML report.
 
         Args:
             result: Analysis result to save
             file_path: Path to the audited file
+            timestamp: When the result was produced. Defaults to now
 
         Returns:
             Path to saved report, or None if templates not available
         """
-        if self.jinja_env is None:
-            logger.warning("Cannot generate HTML report: templates not available")
+        template = self._get_template("audit.html")
+        if template is None:
             return None
 
-        try:
-            template = self.jinja_env.get_template("audit.html")
-        except Exception as e:
-            logger.error(f"Failed to load audit template: {e}")
-            return None
-
-        filename = generate_report_filename("audit", file_path.stem, "html")
+        generated_at = timestamp or datetime.now()
+        file_stamp = generated_at.strftime(FILENAME_TIMESTAMP_FORMAT)
+        filename = generate_report_filename("audit", file_path.stem, "html", file_stamp)
         report_path = self.output_dir / filename
 
         # Read file content for display
-        try:
-            file_content = file_path.read_text(encoding="utf-8")
-        except Exception:
-            file_content = "Unable to read file content"
+        file_content = _read_file_content(file_path)
 
-        # Render template
-        html_content = template.render(
+        # Stream the rendered template to disk, chunk by chunk
+        stream = template.stream(
             file_name=file_path.name,
             file_path=str(file_path),
             file_content=file_content,
@@ -521,9 +565,61 @@ class Reporter:
             weaknesses=result.weaknesses,
             recommendations=result.recommendations,
             detailed_analysis=result.detailed_analysis,
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            timestamp=generated_at.strftime(DISPLAY_TIMESTAMP_FORMAT),
         )
 
-        report_path.write_text(html_content, encoding="utf-8")
+        _dump_stream(stream, report_path)
         logger.info(f"HTML report saved to: {report_path}")
         return report_path
+
+
+def _dump_stream(stream: TemplateStream, report_path: Path) -> None:
+    """Write a template stream through one large buffer, never holding the whole page."""
+    stream.enable_buffering(size=64)
+    with report_path.open("wb", buffering=1 << 16) as fh:
+        stream.dump(fh, encoding="utf-8")
+
+
+def _read_file_content(path: Path) -> str:
+    """Read a reported CLAUDE.md file, reusing the last read while it is unchanged."""
+    try:
+        stat = path.stat()
+        return _read_text_cached(str(path), stat.st_mtime_ns, stat.st_size)
+    except Exception:
+        return "Unable to read file content"
+
+
+@functools.lru_cache(maxsize=64)
+def _read_text_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read and decode a file; mtime and size are part of the key so edits miss."""
+    return Path(path).read_text(encoding="utf-8")
+
+
+@functools.cache
+def _jinja_env() -> Environment:
+    """
+    Build the shared Jinja2 environment on first use.
+
+    Templates are compiled once per process (auto_reload is off, so they are not
+    re-checked on disk), and the compiled bytecode is kept under
+    ~/.claude-md-bench/jinja_cache so later runs skip compilation too.
+
+    Returns:
+        Environment loading the packaged report templates
+    """
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+    cache_dir = Path.home() / ".claude-md-bench" / "jinja_cache"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        bytecode_cache: FileSystemBytecodeCache | None = FileSystemBytecodeCache(str(cache_dir))
+    except OSError as e:
+        logger.warning(f"Template bytecode cache unavailable: {e}")
+        bytecode_cache = None
+
+    return Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        autoescape=select_autoescape(["html", "xml"]),
+        auto_reload=False,
+        bytecode_cache=bytecode_cache,
+    )
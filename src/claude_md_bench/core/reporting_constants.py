@@ -6,6 +6,7 @@ and utility functions used across the reporting system.
 
 from __future__ import annotations
 
+import functools
 from datetime import datetime
 from typing import Final
 
@@ -13,6 +14,21 @@ from typing import Final
 SCORE_HIGH_THRESHOLD: Final[int] = 70
 SCORE_MEDIUM_THRESHOLD: Final[int] = 50
 
+# Timestamp formats for report file names and the "Generated" line in HTML reports
+FILENAME_TIMESTAMP_FORMAT: Final[str] = "%Y%m%d_%H%M%S"
+DISPLAY_TIMESTAMP_FORMAT: Final[str] = "%Y-%m-%d %H:%M:%S"
+
+# Lookup tables indexed by how many thresholds a score meets (low, medium, high)
+_SCORE_STYLES: Final[tuple[str, str, str]] = ("red", "yellow", "green")
+_SCORE_CSS_CLASSES: Final[tuple[str, str, str]] = ("score-low", "score-medium", "score-high")
+# Indexed by the sign of a delta plus one (negative, zero, positive)
+_DELTA_STYLES: Final[tuple[str, str, str]] = ("red", "white", "green")
+
+# Text report rules, prebuilt once rather than per line written
+TEXT_RULE_WIDTH: Final[int] = 70
+TITLE_RULE: Final[str] = "=" * TEXT_RULE_WIDTH + "\n"
+SECTION_RULE: Final[str] = "-" * TEXT_RULE_WIDTH + "\n"
+
 # Dimension list - single source of truth for evaluation dimensions
 DIMENSIONS: Final[tuple[str, ...]] = (
     "clarity",
@@ -22,6 +38,10 @@ DIMENSIONS: Final[tuple[str, ...]] = (
     "context",
 )
 
+# Display titles for DIMENSIONS, plain and padded for text report columns
+DIMENSION_TITLES: Final[tuple[str, ...]] = tuple(dim.title() for dim in DIMENSIONS)
+DIMENSION_LABELS: Final[tuple[str, ...]] = tuple(f"{title:<15}" for title in DIMENSION_TITLES)
+
 
 def get_score_style(score: float) -> str:
     """Return Rich style string based on score threshold.
@@ -32,11 +52,7 @@ def get_score_style(score: float) -> str:
     Returns:
         Rich color string: "green", "yellow", or "red"
     """
-    if score >= SCORE_HIGH_THRESHOLD:
-        return "green"
-    elif score >= SCORE_MEDIUM_THRESHOLD:
-        return "yellow"
-    return "red"
+    return _SCORE_STYLES[(score >= SCORE_MEDIUM_THRESHOLD) + (score >= SCORE_HIGH_THRESHOLD)]
 
 
 def get_score_css_class(score: float) -> str:
@@ -48,11 +64,7 @@ def get_score_css_class(score: float) -> str:
     Returns:
         CSS class string: "score-high", "score-medium", or "score-low"
     """
-    if score >= SCORE_HIGH_THRESHOLD:
-        return "score-high"
-    elif score >= SCORE_MEDIUM_THRESHOLD:
-        return "score-medium"
-    return "score-low"
+    return _SCORE_CSS_CLASSES[(score >= SCORE_MEDIUM_THRESHOLD) + (score >= SCORE_HIGH_THRESHOLD)]
 
 
 def get_delta_style(delta: float) -> str:
@@ -64,25 +76,42 @@ def get_delta_style(delta: float) -> str:
     Returns:
         Rich color string: "green" (positive), "red" (negative), or "white" (zero)
     """
-    if delta > 0:
-        return "green"
-    elif delta < 0:
-        return "red"
-    return "white"
+    return _DELTA_STYLES[(delta > 0) - (delta < 0) + 1]
+
+
+@functools.lru_cache(maxsize=1024)
+def format_size(size: int) -> str:
+    """Format a file size with thousands separators, once per distinct size.
+
+    Args:
+        size: Size in characters
+
+    Returns:
+        Formatted size like "12,345"
+    """
+    return f"{size:,}"
 
 
-def generate_report_filename(prefix: str, name: str, extension: str) -> str:
+def generate_report_filename(
+    prefix: str,
+    name: str,
+    extension: str,
+    timestamp: str | None = None,
+) -> str:
     """Generate timestamped filename with sanitized name.
 
     Args:
         prefix: Report type prefix (e.g., "audit", "comparison")
         name: File or project name to include
         extension: File extension without dot (e.g., "txt", "html")
+        timestamp: Precomputed FILENAME_TIMESTAMP_FORMAT stamp, so reports saved
+            together share one; defaults to the current time
 
     Returns:
         Formatted filename like "audit_project-name_20241130_143022.txt"
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if timestamp is None:
+        timestamp = datetime.now().strftime(FILENAME_TIMESTAMP_FORMAT)
     safe_name = name.replace("/", "_").replace("\\", "_")
     return f"{prefix}_{safe_name}_{timestamp}.{extension}"
 
@@ -92,6 +121,7 @@ def generate_comparison_filename(
     name_a: str,
     name_b: str,
     extension: str,
+    timestamp: str | None = None,
 ) -> str:
     """Generate timestamped filename for comparison reports.
 
@@ -100,11 +130,14 @@ def generate_comparison_filename(
         name_a: First file/project name
         name_b: Second file/project name
         extension: File extension without dot
+        timestamp: Precomputed FILENAME_TIMESTAMP_FORMAT stamp; defaults to the
+            current time
 
     Returns:
         Formatted filename like "comparison_file1_vs_file2_20241130_143022.txt"
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if timestamp is None:
+        timestamp = datetime.now().strftime(FILENAME_TIMESTAMP_FORMAT)
     safe_name_a = name_a.replace("/", "_").replace("\\", "_")
     safe_name_b = name_b.replace("/", "_").replace("\\", "_")
     return f"{prefix}_{safe_name_a}_vs_{safe_name_b}_{timestamp}.{extension}"
@@ -7,14 +7,27 @@ Minimal wrapper for Ollama API calls with error handling, retries, and health ch
 from __future__ import annotations
 
 import logging
+import os
+import random
+import threading
 import time
 from dataclasses import dataclass
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+
+from claude_md_bench import _json
 
 logger = logging.getLogger(__name__)
 
+# Ollama's own default for OLLAMA_NUM_PARALLEL on most hardware
+DEFAULT_MAX_PARALLEL = 4
+
+# Seconds a fetched model list stays valid for check_health() and list_models()
+TAGS_TTL = 5.0
+
 
 @dataclass
 class OllamaConfig:
@@ -24,6 +37,7 @@ class OllamaConfig:
     model: str = "llama3.2:latest"
     timeout: int = 120
     max_retries: int = 3
+    max_parallel: int | None = None
 
 
 class OllamaError(Exception):
@@ -51,6 +65,7 @@ class OllamaClient:
         model: str = "llama3.2:latest",
         timeout: int = 120,
         max_retries: int = 3,
+        max_parallel: int | None = None,
     ) -> None:
         """
         Initialize Ollama client.
@@ -60,12 +75,28 @@ class OllamaClient:
             model: Model name to use for inference
             timeout: Request timeout in seconds
             max_retries: Number of retry attempts on failure
+            max_parallel: Generations allowed in flight at once across threads.
+                Defaults to OLLAMA_NUM_PARALLEL, or 4 if unset.
         """
         self.host = host.rstrip("/")
         self.model = model
         self.timeout = timeout
         self.max_retries = max_retries
         self.api_url = f"{self.host}/api/generate"
+        self.max_parallel = max_parallel or _env_max_parallel()
+        # Requests beyond the server's parallelism would only queue there
+        self._slots = threading.BoundedSemaphore(self.max_parallel)
+
+        # Reuse keep-alive connections across health checks and generations
+        self._session = requests.Session()
+        # One pooled connection per request slot, so parallel calls never reconnect.
+        # Retries stay in generate(), which knows which failures are worth retrying.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_parallel, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # (fetched at, model names) from the last successful /api/tags request
+        self._tags_cache: tuple[float, list[str]] | None = None
 
     @classmethod
     def from_config(cls, config: OllamaConfig) -> OllamaClient:
@@ -75,13 +106,25 @@ class OllamaClient:
             model=config.model,
             timeout=config.timeout,
             max_retries=config.max_retries,
+            max_parallel=config.max_parallel,
         )
 
+    def close(self) -> None:
+        """Close pooled connections to the Ollama server."""
+        self._session.close()
+
+    def __enter__(self) -> OllamaClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def generate(
         self,
         prompt: str,
         system: str | None = None,
         temperature: float = 0.7,
+        stream_until: str | None = None,
     ) -> str:
         """
         Generate text completion from Ollama.
@@ -90,6 +133,9 @@ class OllamaClient:
             prompt: User prompt
             system: Optional system prompt
             temperature: Sampling temperature (0.0 = deterministic)
+            stream_until: Optional stop marker. The connection is closed as soon
+                as the marker appears, which stops generation early. The returned
+                text includes the marker.
 
         Returns:
             Generated text response
@@ -102,7 +148,9 @@ class OllamaClient:
         payload: dict[str, Any] = {
             "model": self.model,
             "prompt": prompt,
-            "stream": False,
+            # Streaming overlaps transfer with generation, and the timeout then
+            # bounds the gap between chunks rather than the whole generation
+            "stream": True,
             "options": {
                 "temperature": temperature,
             },
@@ -115,15 +163,8 @@ class OllamaClient:
             try:
                 logger.debug(f"Ollama request (attempt {attempt + 1}/{self.max_retries})")
 
-                response = requests.post(
-                    self.api_url,
-                    json=payload,
-                    timeout=self.timeout,
-                )
-                response.raise_for_status()
-
-                result = response.json()
-                generated_text: str = str(result.get("response", "")).strip()
+                with self._slots:
+                    generated_text = self._generate_streaming(payload, stream_until).strip()
 
                 if not generated_text:
                     raise OllamaError("Empty response from Ollama")
@@ -133,8 +174,9 @@ class OllamaClient:
 
             except requests.exceptions.ConnectionError as e:
                 logger.warning(f"Ollama connection failed: {e}")
+                self._tags_cache = None
                 if attempt < self.max_retries - 1:
-                    time.sleep(2**attempt)  # Exponential backoff
+                    time.sleep(_backoff(attempt))
                     continue
                 raise OllamaConnectionError(
                     f"Cannot connect to Ollama at {self.host}. "
@@ -144,6 +186,8 @@ class OllamaClient:
             except requests.exceptions.Timeout as e:
                 logger.warning(f"Ollama request timeout: {e}")
                 if attempt < self.max_retries - 1:
+                    # A timeout usually means the server is saturated; give it room
+                    time.sleep(_backoff(attempt))
                     continue
                 raise OllamaTimeoutError(f"Ollama request timed out after {self.timeout}s") from e
 
@@ -151,12 +195,64 @@ class OllamaClient:
                 logger.error(f"Ollama HTTP error: {e}")
                 raise OllamaError(f"Ollama request failed: {e}") from e
 
+            except OllamaError:
+                raise
+
             except Exception as e:
                 logger.error(f"Ollama request failed: {e}")
                 raise OllamaError(f"Ollama request failed: {e}") from e
 
         raise OllamaError("Max retries exceeded")
 
+    def _generate_streaming(
+        self,
+        payload: dict[str, Any],
+        stream_until: str | None,
+    ) -> str:
+        """
+        Stream a generation, stopping early once the stream_until marker appears.
+
+        Closing the response drops the connection, which makes Ollama cancel
+        the rest of the generation.
+        """
+        text = ""
+        # Only new text (plus a marker-sized overlap) is searched per chunk
+        searched = 0
+        with self._session.post(
+            self.api_url,
+            json=payload,
+            timeout=self.timeout,
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+
+            try:
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+
+                    chunk = _json.loads(line)
+                    if "error" in chunk:
+                        raise OllamaError(f"Ollama request failed: {chunk['error']}")
+
+                    text += str(chunk.get("response", ""))
+
+                    if chunk.get("done"):
+                        break
+                    if stream_until is None:
+                        continue
+                    if text.find(stream_until, searched) != -1:
+                        logger.debug(f"Stopping generation early after {len(text)} chars")
+                        break
+                    searched = max(0, len(text) - len(stream_until) + 1)
+            except requests.exceptions.ConnectionError as e:
+                # requests reports a read timeout mid-stream as a ConnectionError
+                if e.args and isinstance(e.args[0], ReadTimeoutError):
+                    raise requests.exceptions.ReadTimeout(e) from e
+                raise
+
+        return text
+
     def check_health(self) -> bool:
         """
         Check if Ollama server is healthy and model is available.
@@ -165,21 +261,14 @@ class OllamaClient:
             True if healthy and model available, False otherwise
         """
         try:
-            # Check server health
-            response = requests.get(f"{self.host}/api/tags", timeout=5)
-            response.raise_for_status()
-
-            # Check if model is available
-            tags_data = response.json()
-            models = [m["name"] for m in tags_data.get("models", [])]
+            models = set(self._get_tags())
 
             # Check for exact match or base model match (e.g., "llama3.2:latest" matches "llama3.2")
-            model_base = self.model.split(":")[0]
-            model_found = any(self.model == m or m.startswith(model_base) for m in models)
-
-            if not model_found:
-                logger.warning(f"Model '{self.model}' not found. Available: {models}")
-                return False
+            if self.model not in models:
+                model_base = self.model.split(":", 1)[0]
+                if model_base not in {m.split(":", 1)[0] for m in models}:
+                    logger.warning(f"Model '{self.model}' not found. Available: {sorted(models)}")
+                    return False
 
             logger.debug(f"Ollama health check passed (model: {self.model})")
             return True
@@ -199,10 +288,51 @@ class OllamaClient:
             List of model names
         """
         try:
-            response = requests.get(f"{self.host}/api/tags", timeout=5)
-            response.raise_for_status()
-            tags_data = response.json()
-            return [m["name"] for m in tags_data.get("models", [])]
+            return list(self._get_tags())
         except Exception as e:
             logger.error(f"Failed to list models: {e}")
             return []
+
+    def _get_tags(self, ttl: float = TAGS_TTL) -> list[str]:
+        """
+        Fetch the names of the server's models, reusing a recent answer.
+
+        A failed request clears the cache, so the next call asks the server again.
+
+        Args:
+            ttl: Seconds a previously fetched list is reused for
+
+        Returns:
+            Model names reported by /api/tags
+        """
+        now = time.monotonic()
+        if self._tags_cache is not None and now - self._tags_cache[0] < ttl:
+            return self._tags_cache[1]
+
+        try:
+            response = self._session.get(f"{self.host}/api/tags", timeout=5)
+            response.raise_for_status()
+            names = [m["name"] for m in response.json().get("models", [])]
+        except Exception:
+            self._tags_cache = None
+            raise
+
+        self._tags_cache = (now, names)
+        return names
+
+
+def _backoff(attempt: int) -> float:
+    """Return the delay before retry attempt + 1: exponential, with jitter.
+
+    The jitter keeps concurrent callers that failed together from retrying in lockstep.
+    """
+    return float(2**attempt) + random.random()
+
+
+def _env_max_parallel() -> int:
+    """Read the concurrency limit from OLLAMA_NUM_PARALLEL."""
+    value = os.environ.get("OLLAMA_NUM_PARALLEL", "")
+    try:
+        return max(1, int(value))
+    except ValueError:
+        return DEFAULT_MAX_PARALLEL
@@ -0,0 +1,227 @@
+"""Shared sample data and mock fixtures for claude-md-bench tests."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from claude_md_bench.core.analyzer import AnalysisResult
+from claude_md_bench.llm.ollama import OllamaClient
+
+
+@pytest.fixture(scope="session")
+def sample_claude_md_content() -> str:
+    """Return sample CLAUDE.md content for testing."""
+    return """# CLAUDE.md
+
+## Project Overview
+This is a test project for validating CLAUDE.md analysis.
+
+## Build Commands
+```bash
+npm run build
+npm run test
+```
+
+## Code Standards
+- Use TypeScript strict mode
+- 80% test coverage required
+- No console.log statements
+
+## Testing
+- Follow TDD approach
+- Use Testing Trophy distribution
+"""
+
+
+@pytest.fixture(scope="session")
+def sample_claude_md_file(
+    tmp_path_factory: pytest.TempPathFactory, sample_claude_md_content: str
+) -> Path:
+    """Create a sample CLAUDE.md file for testing (shared; copy it before editing)."""
+    file_path = tmp_path_factory.mktemp("claude_md") / "CLAUDE.md"
+    file_path.write_text(sample_claude_md_content)
+    return file_path
+
+
+@pytest.fixture(scope="session")
+def minimal_claude_md_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a minimal CLAUDE.md file for testing (shared; copy it before editing)."""
+    file_path = tmp_path_factory.mktemp("claude_md") / "CLAUDE_minimal.md"
+    file_path.write_text("# CLAUDE.md\n\nBasic instructions.")
+    return file_path
+
+
+@pytest.fixture(scope="session")
+def mock_ollama_response() -> str:
+    """Return a mock LLM analysis response."""
+    return """CLARITY: 85
+COMPLETENESS: 70
+ACTIONABILITY: 80
+STANDARDS: 90
+CONTEXT: 75
+OVERALL: 80
+
+STRENGTHS:
+- Clear build commands
+- Good testing standards
+- TypeScript strict mode enforced
+
+WEAKNESSES:
+- Missing architecture documentation
+- No troubleshooting section
+- Limited context about project structure
+
+RECOMMENDATIONS:
+- Add architecture overview
+- Include common pitfalls section
+- Document debugging procedures
+
+DETAILED_ANALYSIS:
+This CLAUDE.md provides good foundational guidance for code quality and testing.
+The build commands are clear and the standards section enforces important practices.
+However, it lacks depth in architecture documentation and troubleshooting guidance.
+"""
+
+
+@pytest.fixture
+def mock_ollama_client(mock_ollama_response: str) -> OllamaClient:
+    """Create a mocked OllamaClient for testing without actual API calls."""
+    client = MagicMock(spec=OllamaClient)
+    client.generate.return_value = mock_ollama_response
+    client.check_health.return_value = True
+    client.list_models.return_value = ["llama3.2:latest", "qwen2.5:32b"]
+    return client
+
+
+class FakeOllamaClient:
+    """Plain OllamaClient stand-in that replays canned responses in order.
+
+    Cheaper than a MagicMock for tests that drive many generate() calls.
+    """
+
+    def __init__(
+        self,
+        responses: Iterable[str] = (),
+        healthy: bool = True,
+        models: list[str] | None = None,
+    ) -> None:
+        self.model = "llama3.2:latest"
+        self.healthy = healthy
+        self.models = models or []
+        self.calls: list[dict[str, Any]] = []
+        self._responses = iter(responses)
+
+    def generate(
+        self,
+        prompt: str,
+        system: str | None = None,
+        temperature: float = 0.7,
+        stream_until: str | None = None,
+    ) -> str:
+        """Record the call and return the next canned response."""
+        self.calls.append(
+            {
+                "prompt": prompt,
+                "system": system,
+                "temperature": temperature,
+                "stream_until": stream_until,
+            }
+        )
+        return next(self._responses)
+
+    def check_health(self) -> bool:
+        """Report the configured health."""
+        return self.healthy
+
+    def list_models(self) -> list[str]:
+        """Return the configured model names."""
+        return list(self.models)
+
+
+@pytest.fixture
+def fake_ollama_client() -> type[FakeOllamaClient]:
+    """Return the FakeOllamaClient factory; call it with the responses to replay."""
+    return FakeOllamaClient
+
+
+@pytest.fixture
+def patched_client(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Make every OllamaClient the commands build return one mock; configure it inline."""
+    client = MagicMock()
+    # The commands import OllamaClient lazily, so patch the source module
+    monkeypatch.setattr("claude_md_bench.llm.ollama.OllamaClient", lambda *a, **k: client)
+    return client
+
+
+@pytest.fixture(scope="session")
+def mock_comparison_result() -> dict[str, Any]:
+    """Return a mock comparison result for testing reporters."""
+    return {
+        "version_a": {
+            "name": "Project A",
+            "path": "/path/to/project-a/CLAUDE.md",
+            "analysis": {
+                "score": 85.0,
+                "file_size": 1500,
+                "dimension_scores": {
+                    "clarity": 85.0,
+                    "completeness": 80.0,
+                    "actionability": 90.0,
+                    "standards": 85.0,
+                    "context": 75.0,
+                },
+                "strengths": ["Clear instructions", "Good standards"],
+                "weaknesses": ["Missing architecture", "No examples"],
+                "recommendations": ["Add examples", "Document architecture"],
+                "detailed_analysis": "Version A analysis...",
+                "error": None,
+            },
+        },
+        "version_b": {
+            "name": "Project B",
+            "path": "/path/to/project-b/CLAUDE.md",
+            "analysis": {
+                "score": 72.0,
+                "file_size": 800,
+                "dimension_scores": {
+                    "clarity": 70.0,
+                    "completeness": 65.0,
+                    "actionability": 75.0,
+                    "standards": 80.0,
+                    "context": 70.0,
+                },
+                "strengths": ["Concise", "Easy to read"],
+                "weaknesses": ["Too brief", "Missing commands"],
+                "recommendations": ["Expand content", "Add commands"],
+                "detailed_analysis": "Version B analysis...",
+                "error": None,
+            },
+        },
+        "winner": "A",
+        "score_delta": 13.0,
+    }
+
+
+@pytest.fixture(scope="session")
+def mock_analysis_result() -> AnalysisResult:
+    """Create a mock AnalysisResult for testing audit functionality."""
+    return AnalysisResult(
+        score=75.0,
+        file_size=1000,
+        dimension_scores={
+            "clarity": 80.0,
+            "completeness": 70.0,
+            "actionability": 75.0,
+            "standards": 80.0,
+            "context": 70.0,
+        },
+        strengths=["Well organized", "Clear commands", "Good standards"],
+        weaknesses=["Missing examples", "No architecture diagram", "Limited context"],
+        recommendations=["Add code examples", "Include system diagram", "Expand troubleshooting"],
+        detailed_analysis="This CLAUDE.md file provides good coverage of basic requirements...",
+    )
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import io
+from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from typing import NamedTuple
+from unittest.mock import MagicMock
 
 import pytest
+from rich.console import Console
 from typer.testing import CliRunner
 
 from claude_md_bench.cli import app
@@ -22,9 +26,54 @@ from claude_md_bench.core.reporting_constants import (
 runner = CliRunner()
 
 
+@pytest.fixture(scope="class")
+def reporter(tmp_path_factory: pytest.TempPathFactory) -> Reporter:
+    """Create one Reporter per test class for tests that only print."""
+    return Reporter(output_dir=tmp_path_factory.mktemp("reports"))
+
+
+@pytest.fixture
+def saving_reporter(tmp_path: Path) -> Reporter:
+    """Create a Reporter with its own output directory for tests that save reports."""
+    return Reporter(output_dir=tmp_path / "reports")
+
+
+class SavedReport(NamedTuple):
+    """A report written by a fixture, with its content read back once."""
+
+    path: Path
+    content: str
+
+
+@pytest.fixture(scope="class")
+def saved_text_report(
+    mock_analysis_result: AnalysisResult, tmp_path_factory: pytest.TempPathFactory
+) -> SavedReport:
+    """Save one audit text report per test class for tests that only inspect it."""
+    report_dir = tmp_path_factory.mktemp("report")
+    file_path = report_dir / "test.md"
+    file_path.write_text("# Test")
+    path = Reporter(output_dir=report_dir).save_audit_text_report(mock_analysis_result, file_path)
+    return SavedReport(path, path.read_text())
+
+
 class TestAuditCommand:
     """Tests for the audit command."""
 
+    @pytest.fixture
+    def mocked_audit_stack(self, monkeypatch: pytest.MonkeyPatch) -> tuple[MagicMock, MagicMock]:
+        """Replace the Ollama client and analyzer with a healthy client and a 75/100 result."""
+        client = MagicMock()
+        client.check_health.return_value = True
+        analyzer = MagicMock()
+        analyzer.cached_analysis.return_value = None
+        analyzer.analyze.return_value = AnalysisResult(score=75.0, file_size=1000)
+        monkeypatch.setattr("claude_md_bench.llm.ollama.OllamaClient", lambda *a, **k: client)
+        monkeypatch.setattr(
+            "claude_md_bench.core.analyzer.ClaudeMDAnalyzer", lambda *a, **k: analyzer
+        )
+        return client, analyzer
+
     def test_audit_file_not_found_shows_error(self, tmp_path: Path) -> None:
         """Should show error for missing file."""
         result = runner.invoke(
@@ -35,21 +84,13 @@ class TestAuditCommand:
         # Typer validates file existence before running command
         assert result.exit_code != 0
 
-    @patch("claude_md_bench.commands.audit.OllamaClient")
-    @patch("claude_md_bench.commands.audit.ClaudeMDAnalyzer")
     def test_audit_successful(
         self,
-        mock_analyzer_class: MagicMock,
-        mock_client_class: MagicMock,
+        mocked_audit_stack: tuple[MagicMock, MagicMock],
         sample_claude_md_file: Path,
     ) -> None:
         """Should complete audit and show results."""
-        # Setup mocks
-        mock_client = MagicMock()
-        mock_client.check_health.return_value = True
-        mock_client_class.return_value = mock_client
-
-        mock_analyzer = MagicMock()
+        _, mock_analyzer = mocked_audit_stack
         mock_analyzer.analyze.return_value = AnalysisResult(
             score=75.0,
             file_size=1000,
@@ -64,7 +105,6 @@ class TestAuditCommand:
             weaknesses=["Missing examples"],
             recommendations=["Add code examples"],
         )
-        mock_analyzer_class.return_value = mock_analyzer
 
         result = runner.invoke(app, ["audit", str(sample_claude_md_file)])
 
@@ -72,62 +112,67 @@ class TestAuditCommand:
         assert "75.0" in result.stdout
         assert "Reports saved" in result.stdout
 
-    @patch("claude_md_bench.commands.audit.OllamaClient")
     def test_audit_ollama_not_running(
         self,
-        mock_client_class: MagicMock,
+        mocked_audit_stack: tuple[MagicMock, MagicMock],
         sample_claude_md_file: Path,
     ) -> None:
         """Should show error when Ollama is not running."""
-        mock_client = MagicMock()
+        mock_client, _ = mocked_audit_stack
         mock_client.check_health.return_value = False
         mock_client.list_models.return_value = []
-        mock_client_class.return_value = mock_client
 
         result = runner.invoke(app, ["audit", str(sample_claude_md_file)])
 
         assert result.exit_code == 1
         assert "Cannot connect to Ollama" in result.stdout
 
-    @patch("claude_md_bench.commands.audit.OllamaClient")
     def test_audit_ollama_connection_error(
         self,
-        mock_client_class: MagicMock,
+        mocked_audit_stack: tuple[MagicMock, MagicMock],
         sample_claude_md_file: Path,
     ) -> None:
         """Should handle Ollama connection error gracefully."""
         from claude_md_bench.llm.ollama import OllamaConnectionError
 
-        mock_client = MagicMock()
+        mock_client, _ = mocked_audit_stack
         mock_client.check_health.side_effect = OllamaConnectionError("Connection refused")
-        mock_client_class.return_value = mock_client
 
         result = runner.invoke(app, ["audit", str(sample_claude_md_file)])
 
         assert result.exit_code == 1
         assert "Connection error" in result.stdout
 
-    @patch("claude_md_bench.commands.audit.OllamaClient")
-    @patch("claude_md_bench.commands.audit.ClaudeMDAnalyzer")
-    def test_audit_quiet_mode(
+    def test_audit_cached_file_skips_ollama(
         self,
-        mock_analyzer_class: MagicMock,
-        mock_client_class: MagicMock,
         sample_claude_md_file: Path,
+        mock_ollama_response: str,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """Should suppress console output in quiet mode."""
-        # Setup mocks
+        """Should reuse the cached analysis without connecting to Ollama."""
         mock_client = MagicMock()
+        mock_client.model = "llama3.2:latest"
         mock_client.check_health.return_value = True
-        mock_client_class.return_value = mock_client
+        mock_client.generate.return_value = mock_ollama_response
+        # The real analyzer and cache run; only the Ollama client is replaced
+        monkeypatch.setattr("claude_md_bench.llm.ollama.OllamaClient", lambda *a, **k: mock_client)
+        args = ["audit", str(sample_claude_md_file), "-o", str(tmp_path), "--quiet"]
 
-        mock_analyzer = MagicMock()
-        mock_analyzer.analyze.return_value = AnalysisResult(
-            score=75.0,
-            file_size=1000,
-        )
-        mock_analyzer_class.return_value = mock_analyzer
+        assert runner.invoke(app, args).exit_code == 0
+        mock_client.check_health.return_value = False
+        result = runner.invoke(app, args)
 
+        assert result.exit_code == 0
+        assert mock_client.check_health.call_count == 1
+        assert mock_client.generate.call_count == 1
+
+    def test_audit_quiet_mode(
+        self,
+        mocked_audit_stack: tuple[MagicMock, MagicMock],
+        sample_claude_md_file: Path,
+    ) -> None:
+        """Should suppress console output in quiet mode."""
         result = runner.invoke(
             app,
             ["audit", str(sample_claude_md_file), "--quiet"],
@@ -139,35 +184,27 @@ class TestAuditCommand:
         # Should not show the audit panel
         assert "Dimension Scores" not in result.stdout
 
-    @patch("claude_md_bench.commands.audit.OllamaClient")
-    @patch("claude_md_bench.commands.audit.ClaudeMDAnalyzer")
-    def test_audit_text_format_only(
+    @pytest.mark.parametrize(
+        "fmt,keep_ext,drop_ext",
+        [("text", "txt", "html"), ("html", "html", "txt")],
+    )
+    def test_audit_single_format_only(
         self,
-        mock_analyzer_class: MagicMock,
-        mock_client_class: MagicMock,
+        mocked_audit_stack: tuple[MagicMock, MagicMock],
         sample_claude_md_file: Path,
         tmp_path: Path,
+        fmt: str,
+        keep_ext: str,
+        drop_ext: str,
     ) -> None:
-        """Should save only text report when format is text."""
-        # Setup mocks
-        mock_client = MagicMock()
-        mock_client.check_health.return_value = True
-        mock_client_class.return_value = mock_client
-
-        mock_analyzer = MagicMock()
-        mock_analyzer.analyze.return_value = AnalysisResult(
-            score=75.0,
-            file_size=1000,
-        )
-        mock_analyzer_class.return_value = mock_analyzer
-
+        """Should save only the report format that was asked for."""
         result = runner.invoke(
             app,
             [
                 "audit",
                 str(sample_claude_md_file),
                 "--format",
-                "text",
+                fmt,
                 "--output-dir",
                 str(tmp_path),
                 "--quiet",
@@ -175,77 +212,21 @@ class TestAuditCommand:
         )
 
         assert result.exit_code == 0
-        # Check that text report was saved
-        text_files = list(tmp_path.glob("audit_*.txt"))
-        assert len(text_files) == 1
-        # Check that HTML report was not saved
-        html_files = list(tmp_path.glob("audit_*.html"))
-        assert len(html_files) == 0
-
-    @patch("claude_md_bench.commands.audit.OllamaClient")
-    @patch("claude_md_bench.commands.audit.ClaudeMDAnalyzer")
-    def test_audit_html_format_only(
-        self,
-        mock_analyzer_class: MagicMock,
-        mock_client_class: MagicMock,
-        sample_claude_md_file: Path,
-        tmp_path: Path,
-    ) -> None:
-        """Should save only HTML report when format is html."""
-        # Setup mocks
-        mock_client = MagicMock()
-        mock_client.check_health.return_value = True
-        mock_client_class.return_value = mock_client
-
-        mock_analyzer = MagicMock()
-        mock_analyzer.analyze.return_value = AnalysisResult(
-            score=75.0,
-            file_size=1000,
-        )
-        mock_analyzer_class.return_value = mock_analyzer
-
-        result = runner.invoke(
-            app,
-            [
-                "audit",
-                str(sample_claude_md_file),
-                "--format",
-                "html",
-                "--output-dir",
-                str(tmp_path),
-                "--quiet",
-            ],
-        )
+        assert len(list(tmp_path.glob(f"audit_*.{keep_ext}"))) == 1
+        assert len(list(tmp_path.glob(f"audit_*.{drop_ext}"))) == 0
 
-        assert result.exit_code == 0
-        # Check that HTML report was saved
-        html_files = list(tmp_path.glob("audit_*.html"))
-        assert len(html_files) == 1
-        # Check that text report was not saved
-        text_files = list(tmp_path.glob("audit_*.txt"))
-        assert len(text_files) == 0
-
-    @patch("claude_md_bench.commands.audit.OllamaClient")
-    @patch("claude_md_bench.commands.audit.ClaudeMDAnalyzer")
     def test_audit_analysis_error(
         self,
-        mock_analyzer_class: MagicMock,
-        mock_client_class: MagicMock,
+        mocked_audit_stack: tuple[MagicMock, MagicMock],
         sample_claude_md_file: Path,
     ) -> None:
         """Should show error when analysis fails."""
-        # Setup mocks
-        mock_client = MagicMock()
-        mock_client.check_health.return_value = True
-        mock_client_class.return_value = mock_client
-
-        mock_analyzer = MagicMock()
+        _, mock_analyzer = mocked_audit_stack
         mock_analyzer.analyze.return_value = AnalysisResult(
             score=0.0,
             file_size=0,
             error="Analysis failed: invalid response",
         )
-        mock_analyzer_class.return_value = mock_analyzer
 
         result = runner.invoke(app, ["audit", str(sample_claude_md_file)])
 
@@ -267,36 +248,62 @@ class TestReporterAuditMethods:
 
     def test_print_audit_displays_results(
         self,
+        reporter: Reporter,
         mock_analysis_result: AnalysisResult,
         tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Should print formatted audit results without error."""
-        reporter = Reporter(output_dir=tmp_path)
         file_path = tmp_path / "test.md"
         file_path.write_text("# Test")
 
         # Should not raise any exceptions
         reporter.print_audit(mock_analysis_result, file_path)
 
-    def test_save_audit_text_report_creates_file(
+    def test_print_audit_plain_mode_skips_rich_table(
         self,
         mock_analysis_result: AnalysisResult,
         tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """Should save text report to file."""
+        """Should print dimension scores as plain aligned lines when requested."""
+        monkeypatch.setenv("CLAUDE_MD_BENCH_PLAIN", "1")
         reporter = Reporter(output_dir=tmp_path)
         file_path = tmp_path / "test.md"
         file_path.write_text("# Test")
 
-        report_path = reporter.save_audit_text_report(mock_analysis_result, file_path)
+        reporter.print_audit(mock_analysis_result, file_path)
 
-        assert report_path.exists()
-        assert report_path.suffix == ".txt"
-        assert "audit_test_" in report_path.name
+        lines = capsys.readouterr().out.splitlines()
+        clarity = mock_analysis_result.dimension_scores["clarity"]
+        assert f"{'Clarity':<15} {clarity:>5.0f}" in lines
+        assert f"{'Dimension':<15} {'Score':>5}" in lines
+        assert not any("┃" in line for line in lines)  # Rich table header border
+
+    def test_print_audit_writes_once(
+        self, mock_analysis_result: AnalysisResult, tmp_path: Path
+    ) -> None:
+        """Should hand the whole audit block to the terminal in a single write."""
+        reporter = Reporter(output_dir=tmp_path)
+        out = MagicMock(wraps=io.StringIO())
+        reporter.console = Console(file=out, width=100)
+        file_path = tmp_path / "test.md"
+        file_path.write_text("# Test")
+
+        reporter.print_audit(mock_analysis_result, file_path)
+
+        assert out.write.call_count == 1
+        assert "Overall Score" in out.write.call_args.args[0]
+
+    def test_save_audit_text_report_creates_file(self, saved_text_report: SavedReport) -> None:
+        """Should save text report to file."""
+        assert saved_text_report.path.exists()
+        assert saved_text_report.path.suffix == ".txt"
+        assert "audit_test_" in saved_text_report.path.name
 
         # Check content
-        content = report_path.read_text()
+        content = saved_text_report.content
         assert "CLAUDE.md Audit Report" in content
         assert "75.0" in content
         assert "Well organized" in content
@@ -304,15 +311,15 @@ class TestReporterAuditMethods:
 
     def test_save_audit_html_report_creates_file(
         self,
+        saving_reporter: Reporter,
         mock_analysis_result: AnalysisResult,
         tmp_path: Path,
     ) -> None:
         """Should save HTML report to file."""
-        reporter = Reporter(output_dir=tmp_path)
         file_path = tmp_path / "test.md"
         file_path.write_text("# Test Content")
 
-        report_path = reporter.save_audit_html_report(mock_analysis_result, file_path)
+        report_path = saving_reporter.save_audit_html_report(mock_analysis_result, file_path)
 
         assert report_path is not None
         assert report_path.exists()
@@ -325,17 +332,10 @@ class TestReporterAuditMethods:
         assert "75.0" in content
 
     def test_save_audit_text_report_includes_all_sections(
-        self,
-        mock_analysis_result: AnalysisResult,
-        tmp_path: Path,
+        self, saved_text_report: SavedReport
     ) -> None:
         """Should include all analysis sections in text report."""
-        reporter = Reporter(output_dir=tmp_path)
-        file_path = tmp_path / "test.md"
-        file_path.write_text("# Test")
-
-        report_path = reporter.save_audit_text_report(mock_analysis_result, file_path)
-        content = report_path.read_text()
+        content = saved_text_report.content
 
         # Check all sections are present
         assert "Dimension Scores" in content
@@ -353,10 +353,10 @@ class TestReporterAuditMethods:
 
     def test_save_audit_text_report_with_empty_lists(
         self,
+        saving_reporter: Reporter,
         tmp_path: Path,
     ) -> None:
         """Should handle empty strengths/weaknesses/recommendations."""
-        reporter = Reporter(output_dir=tmp_path)
         file_path = tmp_path / "test.md"
         file_path.write_text("# Test")
 
@@ -369,7 +369,7 @@ class TestReporterAuditMethods:
             recommendations=[],
         )
 
-        report_path = reporter.save_audit_text_report(result, file_path)
+        report_path = saving_reporter.save_audit_text_report(result, file_path)
 
         assert report_path.exists()
         content = report_path.read_text()
@@ -377,22 +377,43 @@ class TestReporterAuditMethods:
 
     def test_save_audit_html_report_with_file_content(
         self,
+        saving_reporter: Reporter,
         mock_analysis_result: AnalysisResult,
         tmp_path: Path,
     ) -> None:
         """Should include file content in HTML report."""
-        reporter = Reporter(output_dir=tmp_path)
         file_path = tmp_path / "test.md"
         test_content = "# Test CLAUDE.md\n\nThis is test content."
         file_path.write_text(test_content)
 
-        report_path = reporter.save_audit_html_report(mock_analysis_result, file_path)
+        report_path = saving_reporter.save_audit_html_report(mock_analysis_result, file_path)
 
         assert report_path is not None
         html_content = report_path.read_text()
         assert "View CLAUDE.md Content" in html_content
         assert test_content in html_content
 
+    def test_reports_use_the_result_timestamp(
+        self,
+        saving_reporter: Reporter,
+        mock_analysis_result: AnalysisResult,
+        tmp_path: Path,
+    ) -> None:
+        """Should name and stamp both formats with the timestamp passed for the result."""
+        file_path = tmp_path / "test.md"
+        file_path.write_text("# Test")
+        first = datetime(2025, 1, 2, 3, 4, 5)
+        second = datetime(2025, 1, 2, 3, 4, 6)
+
+        text_path = saving_reporter.save_audit_text_report(mock_analysis_result, file_path, first)
+        html_path = saving_reporter.save_audit_html_report(mock_analysis_result, file_path, first)
+        later_path = saving_reporter.save_audit_text_report(mock_analysis_result, file_path, second)
+
+        assert html_path is not None
+        assert text_path.stem == html_path.stem == "audit_test_20250102_030405"
+        assert f"Generated: {first.isoformat()}" in text_path.read_text()
+        assert later_path != text_path
+
     def test_reporter_creates_output_directory(self, tmp_path: Path) -> None:
         """Should create output directory if it doesn't exist."""
         new_dir = tmp_path / "new_reports"
@@ -454,6 +475,15 @@ class TestReportingConstants:
         # Should contain timestamp pattern YYYYMMDD_HHMMSS
         assert len(filename) == len("audit_test-file_YYYYMMDD_HHMMSS.txt")
 
+    def test_generate_filenames_use_given_timestamp(self) -> None:
+        """Should use a precomputed timestamp instead of reading the clock."""
+        assert generate_report_filename("audit", "f", "txt", "20240101_000000") == (
+            "audit_f_20240101_000000.txt"
+        )
+        assert generate_comparison_filename("cmp", "a", "b", "html", "20240101_000000") == (
+            "cmp_a_vs_b_20240101_000000.html"
+        )
+
     def test_generate_report_filename_sanitizes_slashes(self) -> None:
         """Should replace slashes in name with underscores."""
         filename = generate_report_filename("audit", "path/to/file", "txt")
@@ -0,0 +1,69 @@
+"""Tests for the analysis cache module."""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+
+from claude_md_bench.core.cache import AnalysisCache
+
+
+class TestAnalysisCache:
+    """Tests for AnalysisCache class."""
+
+    def test_get_returns_none_on_miss(self, tmp_path: Path) -> None:
+        """Should return None for an unknown key."""
+        cache = AnalysisCache(path=tmp_path / "cache.db")
+
+        assert cache.get("missing") is None
+
+    def test_put_then_get_round_trips(self, tmp_path: Path) -> None:
+        """Should return the stored result fields."""
+        cache = AnalysisCache(path=tmp_path / "cache.db")
+        value = {"score": 80.0, "strengths": ["Clear"]}
+
+        cache.put("key", value)
+
+        assert cache.get("key") == value
+
+    @pytest.mark.parametrize("payload", ["{not json", "[1, 2]"])
+    def test_corrupt_payload_is_a_miss(self, tmp_path: Path, payload: str) -> None:
+        """Should treat an undecodable or non-object payload as a miss."""
+        cache = AnalysisCache(path=tmp_path / "cache.db")
+        cache.put("key", {"score": 1.0})
+        with closing(sqlite3.connect(tmp_path / "cache.db")) as conn, conn:
+            conn.execute("UPDATE analyses SET payload = ? WHERE key = 'key'", (payload,))
+
+        assert cache.get("key") is None
+
+    def test_database_created_lazily(self, tmp_path: Path) -> None:
+        """Should not touch the filesystem until first use."""
+        db_path = tmp_path / "nested" / "cache.db"
+
+        AnalysisCache(path=db_path)
+
+        assert not db_path.exists()
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        """Should drop the least recently used entry beyond the cap."""
+        cache = AnalysisCache(path=tmp_path / "cache.db", max_entries=2)
+        cache.put("a", {"score": 1.0})
+        cache.put("b", {"score": 2.0})
+        cache.get("a")  # "b" is now least recently used
+
+        cache.put("c", {"score": 3.0})
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_make_key_depends_on_model_and_prompt(self) -> None:
+        """Should produce distinct keys for different models or prompts."""
+        key = AnalysisCache.make_key("llama3.2:latest", "system", "prompt")
+
+        assert key == AnalysisCache.make_key("llama3.2:latest", "system", "prompt")
+        assert key != AnalysisCache.make_key("qwen2.5:32b", "system", "prompt")
+        assert key != AnalysisCache.make_key("llama3.2:latest", "system", "other prompt")
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
+from collections.abc import Callable
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
+import pytest
 from typer.testing import CliRunner
 
 from claude_md_bench.cli import app
@@ -12,6 +16,18 @@ from claude_md_bench.cli import app
 runner = CliRunner()
 
 
+@pytest.fixture
+def mock_ollama_cli(patched_client: MagicMock) -> Callable[..., MagicMock]:
+    """Return a factory that makes the CLI build a mock client listing the given models."""
+
+    def _make(models: list[str], healthy: bool = True) -> MagicMock:
+        patched_client.list_models.return_value = models
+        patched_client.check_health.return_value = healthy
+        return patched_client
+
+    return _make
+
+
 class TestVersionCommand:
     """Tests for the version command."""
 
@@ -27,12 +43,9 @@ class TestVersionCommand:
 class TestCheckCommand:
     """Tests for the check command."""
 
-    @patch("claude_md_bench.cli.OllamaClient")
-    def test_check_success_with_models(self, mock_client_class: MagicMock) -> None:
+    def test_check_success_with_models(self, mock_ollama_cli: Callable[..., MagicMock]) -> None:
         """Should show available models when Ollama is running."""
-        mock_client = MagicMock()
-        mock_client.list_models.return_value = ["llama3.2:latest", "qwen2.5:32b"]
-        mock_client_class.return_value = mock_client
+        mock_ollama_cli(["llama3.2:latest", "qwen2.5:32b"])
 
         result = runner.invoke(app, ["check"])
 
@@ -40,39 +53,31 @@ class TestCheckCommand:
         assert "Ollama is running" in result.stdout
         assert "llama3.2:latest" in result.stdout
 
-    @patch("claude_md_bench.cli.OllamaClient")
     def test_check_fails_when_ollama_not_running(
-        self,
-        mock_client_class: MagicMock,
+        self, mock_ollama_cli: Callable[..., MagicMock]
     ) -> None:
         """Should show error when Ollama is not running."""
-        mock_client = MagicMock()
-        mock_client.list_models.return_value = []
-        mock_client_class.return_value = mock_client
+        mock_ollama_cli([])
 
         result = runner.invoke(app, ["check"])
 
         assert result.exit_code == 1
         assert "Cannot connect to Ollama" in result.stdout
 
-    @patch("claude_md_bench.cli.OllamaClient")
-    def test_check_specific_model_found(self, mock_client_class: MagicMock) -> None:
+    def test_check_specific_model_found(self, mock_ollama_cli: Callable[..., MagicMock]) -> None:
         """Should confirm when specific model is available."""
-        mock_client = MagicMock()
-        mock_client.list_models.return_value = ["llama3.2:latest"]
-        mock_client_class.return_value = mock_client
+        mock_ollama_cli(["llama3.2:latest"])
 
         result = runner.invoke(app, ["check", "--model", "llama3.2:latest"])
 
         assert result.exit_code == 0
         assert "is available" in result.stdout
 
-    @patch("claude_md_bench.cli.OllamaClient")
-    def test_check_specific_model_not_found(self, mock_client_class: MagicMock) -> None:
+    def test_check_specific_model_not_found(
+        self, mock_ollama_cli: Callable[..., MagicMock]
+    ) -> None:
         """Should warn when specific model is not available."""
-        mock_client = MagicMock()
-        mock_client.list_models.return_value = ["llama3.2:latest"]
-        mock_client_class.return_value = mock_client
+        mock_ollama_cli(["llama3.2:latest"])
 
         result = runner.invoke(app, ["check", "--model", "nonexistent:model"])
 
@@ -83,12 +88,9 @@ class TestCheckCommand:
 class TestModelsCommand:
     """Tests for the models command."""
 
-    @patch("claude_md_bench.cli.OllamaClient")
-    def test_models_lists_available(self, mock_client_class: MagicMock) -> None:
+    def test_models_lists_available(self, mock_ollama_cli: Callable[..., MagicMock]) -> None:
         """Should list all available models."""
-        mock_client = MagicMock()
-        mock_client.list_models.return_value = ["llama3.2:latest", "qwen2.5:32b"]
-        mock_client_class.return_value = mock_client
+        mock_ollama_cli(["llama3.2:latest", "qwen2.5:32b"])
 
         result = runner.invoke(app, ["models"])
 
@@ -111,17 +113,15 @@ class TestCompareCommand:
         # Typer validates file existence before running command
         assert result.exit_code != 0
 
-    @patch("claude_md_bench.commands.compare.OllamaClient")
     def test_compare_with_valid_files(
         self,
-        mock_client_class: MagicMock,
+        patched_client: MagicMock,
         sample_claude_md_file: Path,
         minimal_claude_md_file: Path,
     ) -> None:
         """Should run comparison with valid files."""
-        mock_client = MagicMock()
-        mock_client.check_health.return_value = True
-        mock_client.generate.return_value = """CLARITY: 80
+        patched_client.check_health.return_value = True
+        patched_client.generate.return_value = """CLARITY: 80
 COMPLETENESS: 75
 ACTIONABILITY: 82
 STANDARDS: 85
@@ -140,7 +140,6 @@ RECOMMENDATIONS:
 DETAILED_ANALYSIS:
 Analysis complete.
 """
-        mock_client_class.return_value = mock_client
 
         result = runner.invoke(
             app,
@@ -155,18 +154,14 @@ Analysis complete.
         assert result.exit_code == 0
         assert "Reports saved" in result.stdout
 
-    @patch("claude_md_bench.commands.compare.OllamaClient")
     def test_compare_ollama_not_running(
         self,
-        mock_client_class: MagicMock,
+        mock_ollama_cli: Callable[..., MagicMock],
         sample_claude_md_file: Path,
         minimal_claude_md_file: Path,
     ) -> None:
         """Should show error when Ollama is not running."""
-        mock_client = MagicMock()
-        mock_client.check_health.return_value = False
-        mock_client.list_models.return_value = []
-        mock_client_class.return_value = mock_client
+        mock_ollama_cli([], healthy=False)
 
         result = runner.invoke(
             app,
@@ -194,3 +189,15 @@ class TestMainCallback:
 
         assert result.exit_code == 0
         assert "Usage:" in result.stdout
+
+    def test_import_skips_heavy_dependencies(self) -> None:
+        """Loading the CLI should not import the HTTP client or template engine."""
+        code = (
+            "import sys, claude_md_bench.cli; "
+            "print(sorted({'requests', 'jinja2'} & set(sys.modules)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
@@ -0,0 +1,42 @@
+"""Tests for the JSON helpers."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import pytest
+
+from claude_md_bench import _json
+
+
+@dataclass(slots=True)
+class _Result:
+    score: float
+    strengths: list[str] = field(default_factory=list)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_round_trip_with_either_backend(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    """Should serialize to str and parse bytes or str, with or without orjson."""
+    if use_orjson and not _json.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(_json, "HAS_ORJSON", use_orjson)
+    value = {"score": 72.5, "strengths": ["Clear ✓"], "error": None}
+
+    text = _json.dumps(value)
+
+    assert isinstance(text, str)
+    assert _json.loads(text) == value
+    assert _json.loads(text.encode("utf-8")) == value
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_serializes_dataclasses(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    """Should write dataclass instances as objects of their fields."""
+    if use_orjson and not _json.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(_json, "HAS_ORJSON", use_orjson)
+
+    text = _json.dumps({"result": _Result(score=80.0, strengths=["Clear"])})
+
+    assert _json.loads(text) == {"result": {"score": 80.0, "strengths": ["Clear"]}}
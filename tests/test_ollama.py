@@ -0,0 +1,246 @@
+"""Tests for the Ollama client wrapper."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from urllib3.exceptions import ReadTimeoutError
+
+from claude_md_bench.llm.ollama import OllamaClient, OllamaError, OllamaTimeoutError
+
+
+def _stream_response(*chunks: dict[str, object]) -> MagicMock:
+    """Build a fake streaming response yielding NDJSON lines."""
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.iter_lines.return_value = iter(json.dumps(c).encode() for c in chunks)
+    return response
+
+
+@pytest.fixture
+def mock_session() -> Iterator[MagicMock]:
+    """Patch requests.Session so clients talk to a mock instead of the network."""
+    with patch("claude_md_bench.llm.ollama.requests.Session") as session_class:
+        yield session_class.return_value
+
+
+class TestConnectionReuse:
+    """Tests for OllamaClient connection pooling."""
+
+    def test_requests_share_one_session(self, mock_session: MagicMock) -> None:
+        """Should route every request through the client's session."""
+        mock_session.get.return_value.json.return_value = {"models": [{"name": "llama3.2:latest"}]}
+        mock_session.post.return_value = _stream_response({"response": "Hi", "done": True})
+        client = OllamaClient()
+
+        client.check_health()
+        client.list_models()
+        client.generate("Hello")
+
+        # list_models() reuses the model list check_health() just fetched
+        assert mock_session.get.call_count == 1
+        assert mock_session.post.call_count == 1
+
+    def test_pool_sized_to_parallel_limit(self, mock_session: MagicMock) -> None:
+        """Should keep one pooled connection per concurrent request slot."""
+        OllamaClient(max_parallel=6)
+
+        adapter = mock_session.mount.call_args[0][1]
+        assert adapter._pool_maxsize == 6
+        assert adapter.max_retries.total == 0
+
+    def test_context_manager_closes_session(self, mock_session: MagicMock) -> None:
+        """Should close pooled connections when leaving the with block."""
+        with OllamaClient() as client:
+            assert isinstance(client, OllamaClient)
+            mock_session.close.assert_not_called()
+
+        mock_session.close.assert_called_once()
+
+
+class TestGenerate:
+    """Tests for OllamaClient.generate."""
+
+    def test_generate_returns_response_text(self, mock_session: MagicMock) -> None:
+        """Should join the streamed chunks and return the stripped text."""
+        mock_post = mock_session.post
+        mock_post.return_value = _stream_response(
+            {"response": "  Hel", "done": False},
+            {"response": "lo  ", "done": False},
+            {"response": "", "done": True},
+            {"response": " after done", "done": False},
+        )
+        client = OllamaClient()
+
+        result = client.generate("Hi")
+
+        assert result == "Hello"
+        assert mock_post.call_args[1]["json"]["stream"] is True
+        assert mock_post.call_args[1]["stream"] is True
+
+    def test_generate_stops_stream_when_marker_arrives(self, mock_session: MagicMock) -> None:
+        """Should stop reading once the stream_until marker arrives, even split across chunks."""
+        mock_post = mock_session.post
+        response = _stream_response(
+            {"response": "SCORE: 80\n", "done": False},
+            {"response": "ST", "done": False},
+            {"response": "OP", "done": False},
+            {"response": " never read", "done": False},
+        )
+        mock_post.return_value = response
+        client = OllamaClient()
+
+        result = client.generate("Hi", stream_until="STOP")
+
+        assert result == "SCORE: 80\nSTOP"
+        assert mock_post.call_args[1]["json"]["stream"] is True
+        response.__exit__.assert_called_once()
+
+    def test_generate_stream_raises_on_error_chunk(self, mock_session: MagicMock) -> None:
+        """Should raise OllamaError when the stream reports an error."""
+        mock_session.post.return_value = _stream_response({"error": "model not found"})
+        client = OllamaClient(max_retries=1)
+
+        with pytest.raises(OllamaError, match="model not found") as excinfo:
+            client.generate("Hi", stream_until="STOP")
+
+        assert str(excinfo.value) == "Ollama request failed: model not found"
+
+    def test_generate_maps_mid_stream_read_timeout(self, mock_session: MagicMock) -> None:
+        """Should report a read timeout while streaming as a timeout, not a connection error."""
+        response = _stream_response()
+        response.iter_lines.side_effect = requests.exceptions.ConnectionError(
+            ReadTimeoutError(None, "/api/generate", "Read timed out.")
+        )
+        mock_session.post.return_value = response
+        client = OllamaClient(max_retries=1)
+
+        with pytest.raises(OllamaTimeoutError):
+            client.generate("Hi")
+
+    @pytest.mark.parametrize(
+        "error", [requests.exceptions.Timeout, requests.exceptions.ConnectionError]
+    )
+    def test_generate_backs_off_before_retrying(
+        self, mock_session: MagicMock, error: type[Exception]
+    ) -> None:
+        """Should sleep with growing, jittered delays between failed attempts."""
+        mock_session.post.side_effect = [
+            error("slow"),
+            error("slow"),
+            _stream_response({"response": "ok", "done": True}),
+        ]
+        client = OllamaClient(max_retries=3)
+
+        with patch("claude_md_bench.llm.ollama.time.sleep") as sleep:
+            assert client.generate("Hi") == "ok"
+
+        first, second = (c.args[0] for c in sleep.call_args_list)
+        assert 1 <= first < 2
+        assert 2 <= second < 3
+
+
+class TestCheckHealth:
+    """Tests for OllamaClient.check_health model matching."""
+
+    @pytest.mark.parametrize(
+        "model,available,expected",
+        [
+            ("llama3.2:latest", ["llama3.2:latest"], True),
+            ("llama3.2:latest", ["qwen2.5:32b", "llama3.2:3b"], True),
+            ("llama3.2", ["llama3.2:latest"], True),
+            ("llama3.2:latest", ["llama3.2-vision:latest"], False),
+            ("llama3.2:latest", [], False),
+        ],
+    )
+    def test_matches_exact_or_base_model(
+        self,
+        mock_session: MagicMock,
+        model: str,
+        available: list[str],
+        expected: bool,
+    ) -> None:
+        """Should accept an exact tag or another tag of the same base model."""
+        mock_session.get.return_value.json.return_value = {
+            "models": [{"name": name} for name in available]
+        }
+
+        assert OllamaClient(model=model).check_health() is expected
+
+
+class TestTagsCache:
+    """Tests for reuse of the /api/tags model list."""
+
+    def test_refetches_after_ttl(self, mock_session: MagicMock) -> None:
+        """Should reuse a fresh model list and fetch again once it expires."""
+        mock_session.get.return_value.json.return_value = {"models": [{"name": "llama3.2:latest"}]}
+        client = OllamaClient()
+
+        with patch("claude_md_bench.llm.ollama.time.monotonic", side_effect=[100.0, 104.0, 106.0]):
+            assert client.check_health() is True
+            assert client.list_models() == ["llama3.2:latest"]
+            assert mock_session.get.call_count == 1
+
+            client.list_models()
+            assert mock_session.get.call_count == 2
+
+    def test_failed_fetch_clears_cache(self, mock_session: MagicMock) -> None:
+        """Should ask the server again after a failed request instead of serving stale data."""
+        mock_session.get.return_value.json.return_value = {"models": [{"name": "llama3.2:latest"}]}
+        client = OllamaClient()
+        assert client.check_health() is True
+
+        client._tags_cache = (float("-inf"), ["llama3.2:latest"])
+        mock_session.get.side_effect = requests.exceptions.ConnectionError("refused")
+        assert client.check_health() is False
+        assert client._tags_cache is None
+
+        mock_session.get.side_effect = None
+        assert client.list_models() == ["llama3.2:latest"]
+        assert mock_session.get.call_count == 3
+
+
+class TestParallelLimit:
+    """Tests for the client-side concurrency limit."""
+
+    def test_limit_defaults_to_ollama_num_parallel(
+        self, mock_session: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should read the limit from OLLAMA_NUM_PARALLEL."""
+        monkeypatch.setenv("OLLAMA_NUM_PARALLEL", "2")
+
+        assert OllamaClient().max_parallel == 2
+        assert OllamaClient(max_parallel=3).max_parallel == 3
+
+    def test_generate_respects_limit(self, mock_session: MagicMock) -> None:
+        """Should not have more requests in flight than max_parallel."""
+        lock = threading.Lock()
+        active = peak = 0
+
+        def post(*_: object, **__: object) -> MagicMock:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return _stream_response({"response": "ok", "done": True})
+
+        mock_session.post.side_effect = post
+        client = OllamaClient(max_parallel=2)
+
+        threads = [threading.Thread(target=client.generate, args=("Hi",)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_session.post.call_count == 5
+        assert peak == 2
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
+from typer.testing import CliRunner
 
+from claude_md_bench.cli import app
 from claude_md_bench.core.analyzer import AnalysisResult
 from claude_md_bench.core.optimizer import (
     ClaudeMDOptimizer,
@@ -14,13 +16,141 @@ from claude_md_bench.core.optimizer import (
     OptimizationIteration,
     OptimizationResult,
 )
+from claude_md_bench.core.reporting_constants import DIMENSIONS
+from tests._fixtures import FakeOllamaClient
+
+runner = CliRunner()
+
+
+def _analysis(overall: float, *weaknesses: str, **dims: float) -> str:
+    """Build a mock analysis response; unlisted dimensions score the overall value."""
+    scores = "\n".join(f"{dim.upper()}: {dims.get(dim, overall):g}" for dim in DIMENSIONS)
+    bullets = "\n".join(f"- {w}" for w in weaknesses or ("Minor gaps",))
+    return (
+        f"{scores}\nOVERALL: {overall:g}\n\n"
+        "STRENGTHS:\n- Clear commands\n\n"
+        f"WEAKNESSES:\n{bullets}\n\n"
+        "RECOMMENDATIONS:\n- Add examples\n\n"
+        "DETAILED_ANALYSIS:\nAnalysis."
+    )
+
+
+def _improved(body: str) -> str:
+    """Build a mock rewrite response wrapping body in the CLAUDE.md markers."""
+    return f"<<<BEGIN_CLAUDE_MD>>>\n# CLAUDE.md\n\n{body}\n<<<END_CLAUDE_MD>>>"
+
+
+@pytest.fixture
+def sample_claude_md_file(tmp_path: Path, sample_claude_md_content: str) -> Path:
+    """Give each test its own CLAUDE.md, since the optimizer writes beside its input."""
+    file_path = tmp_path / "CLAUDE.md"
+    file_path.write_text(sample_claude_md_content)
+    return file_path
+
+
+@pytest.fixture(scope="session")
+def mock_improved_response() -> str:
+    """Return a mock improved CLAUDE.md response."""
+    return """<<<BEGIN_CLAUDE_MD>>>
+# CLAUDE.md
+
+## Project Overview
+This is an improved CLAUDE.md with better guidance.
+
+## Build Commands
+```bash
+npm run build
+npm run test
+npm run lint
+```
+
+## Code Standards
+- Use TypeScript strict mode
+- 80% test coverage required
+- No console.log statements
+- Run quality checks after every change
+
+## Testing
+- Follow TDD approach: RED-GREEN-REFACTOR
+- Use Testing Trophy distribution
+- Write tests before implementation
+<<<END_CLAUDE_MD>>>"""
+
+
+@pytest.fixture(scope="session")
+def mock_analysis_responses() -> list[str]:
+    """Return mock analysis responses for optimization iterations."""
+    return [
+        # Initial analysis (baseline)
+        _analysis(
+            68,
+            "Missing TDD workflow",
+            "Incomplete standards",
+            clarity=70,
+            completeness=65,
+            actionability=75,
+            standards=70,
+            context=60,
+        ),
+        # After iteration 1
+        _analysis(
+            77,
+            "Could add more examples",
+            clarity=78,
+            completeness=75,
+            actionability=80,
+            standards=82,
+            context=70,
+        ),
+        # After iteration 2
+        _analysis(
+            82,
+            "Minor gaps remain",
+            clarity=82,
+            completeness=80,
+            actionability=85,
+            standards=88,
+            context=78,
+        ),
+    ]
+
+
+@pytest.fixture(scope="session")
+def mock_improved_contents() -> list[str]:
+    """Return mock improved CLAUDE.md contents."""
+    return [
+        """<<<BEGIN_CLAUDE_MD>>>
+# CLAUDE.md
+
+## Project Overview
+Improved in iteration 1.
+
+## TDD Workflow
+Follow RED-GREEN-REFACTOR.
+<<<END_CLAUDE_MD>>>""",
+        """<<<BEGIN_CLAUDE_MD>>>
+# CLAUDE.md
+
+## Project Overview
+Improved in iteration 2.
+
+## TDD Workflow
+Follow RED-GREEN-REFACTOR with examples.
+
+## Examples
+```python
+def test_example():
+    assert True
+```
+<<<END_CLAUDE_MD>>>""",
+    ]
 
 
 class TestOptimizationDataclasses:
     """Tests for optimization dataclasses."""
 
-    def test_create_optimization_iteration(self) -> None:
-        """Should create optimization iteration with all fields."""
+    def test_optimization_dataclasses(self) -> None:
+        """Should create an iteration with all fields and a result with defaults."""
         analysis = AnalysisResult(score=85.0, file_size=1500)
         iteration = OptimizationIteration(
             iteration=1,
@@ -38,8 +168,6 @@ class TestOptimizationDataclasses:
         assert iteration.content == "# CLAUDE.md\n\nImproved content"
         assert iteration.analysis == analysis
 
-    def test_create_optimization_result(self) -> None:
-        """Should create optimization result with default values."""
         result = OptimizationResult(
             original_score=70.0,
             final_score=85.0,
@@ -58,34 +186,6 @@ class TestOptimizationDataclasses:
 class TestMetaPrompter:
     """Tests for MetaPrompter class."""
 
-    @pytest.fixture
-    def mock_improved_response(self) -> str:
-        """Return a mock improved CLAUDE.md response."""
-        return """<<<BEGIN_CLAUDE_MD>>>
-# CLAUDE.md
-
-## Project Overview
-This is an improved CLAUDE.md with better guidance.
-
-## Build Commands
-```bash
-npm run build
-npm run test
-npm run lint
-```
-
-## Code Standards
-- Use TypeScript strict mode
-- 80% test coverage required
-- No console.log statements
-- Run quality checks after every change
-
-## Testing
-- Follow TDD approach: RED-GREEN-REFACTOR
-- Use Testing Trophy distribution
-- Write tests before implementation
-<<<END_CLAUDE_MD>>>"""
-
     def test_improve_returns_content(
         self,
         mock_ollama_client: MagicMock,
@@ -138,14 +238,56 @@ npm run lint
         assert "system" in call_kwargs
         assert call_kwargs["temperature"] == 0.5
 
-    def test_extract_clean_claude_md_with_markers(
+    def test_analyze_and_improve_splits_evaluation_and_content(
+        self,
+        mock_ollama_client: MagicMock,
+        mock_improved_response: str,
+    ) -> None:
+        """Should return the evaluation and the extracted improved content."""
+        mock_ollama_client.generate.return_value = (
+            "CLARITY: 70\nOVERALL: 70\n\nWEAKNESSES:\n- Thin\n\n" + mock_improved_response
+        )
+        prompter = MetaPrompter(mock_ollama_client)
+
+        evaluation, improved = prompter.analyze_and_improve("# CLAUDE.md\n\nContent")
+
+        assert evaluation.startswith("CLARITY: 70")
+        assert "<<<BEGIN_CLAUDE_MD>>>" not in evaluation
+        assert improved.startswith("# CLAUDE.md")
+        assert "CLARITY" not in improved
+
+    @pytest.mark.parametrize("builder", ["meta", "fused"])
+    def test_prompt_instructions_precede_iteration_content(
         self,
         mock_ollama_client: MagicMock,
+        builder: str,
     ) -> None:
-        """Should extract content between markers."""
+        """Should put the invariant instructions first so prompts share a prefix."""
         prompter = MetaPrompter(mock_ollama_client)
+        analyses = [
+            AnalysisResult(score=60.0, file_size=10, weaknesses=["Thin testing section"]),
+            AnalysisResult(score=75.0, file_size=20, recommendations=["Add examples"]),
+        ]
 
-        raw_output = """Here's the improved version:
+        if builder == "meta":
+            first, second = (
+                prompter._build_meta_prompt(f"# CLAUDE.md v{i}", analysis, i)
+                for i, analysis in enumerate(analyses, 1)
+            )
+        else:
+            first, second = (prompter._build_fused_prompt(f"# CLAUDE.md v{i}", i) for i in (1, 2))
+
+        shared = first.index("## Current CLAUDE.md")
+        assert first[:shared] == second[:shared]
+        assert "Iteration" not in first[:shared]
+        assert "# CLAUDE.md v1" in first[shared:]
+
+    @pytest.mark.parametrize(
+        "raw_output,expect_in,expect_not_in",
+        [
+            # Content between markers
+            (
+                """Here's the improved version:
 
 <<<BEGIN_CLAUDE_MD>>>
 # CLAUDE.md
@@ -154,22 +296,13 @@ npm run lint
 Improved content here.
 <<<END_CLAUDE_MD>>>
 
-Hope this helps!"""
-
-        result = prompter._extract_clean_claude_md(raw_output)
-
-        assert result.startswith("# CLAUDE.md")
-        assert "Improved content here" in result
-        assert "Hope this helps" not in result
-
-    def test_extract_clean_claude_md_without_markers(
-        self,
-        mock_ollama_client: MagicMock,
-    ) -> None:
-        """Should extract content using pattern matching when markers missing."""
-        prompter = MetaPrompter(mock_ollama_client)
-
-        raw_output = """I've improved the file:
+Hope this helps!""",
+                "Improved content here",
+                "Hope this helps",
+            ),
+            # Header pattern when markers are missing
+            (
+                """I've improved the file:
 
 # CLAUDE.md
 
@@ -177,145 +310,62 @@ Hope this helps!"""
 Better documentation here.
 
 ## Commands
-Run the tests."""
-
-        result = prompter._extract_clean_claude_md(raw_output)
-
-        assert result.startswith("# CLAUDE.md")
-        assert "Better documentation" in result
-        assert "I've improved" not in result
-
-    def test_extract_removes_meta_text_patterns(
-        self,
-        mock_ollama_client: MagicMock,
-    ) -> None:
-        """Should remove common meta-text patterns from output."""
-        prompter = MetaPrompter(mock_ollama_client)
-
-        raw_output = """# CLAUDE.md Improvement Task
+Run the tests.""",
+                "Better documentation",
+                "I've improved",
+            ),
+            # Echoed prompt headings before the real content
+            (
+                """# CLAUDE.md Improvement Task
 
 ## Current CLAUDE.md
 
 # CLAUDE.md
 
 ## Real Content
-This is the actual content."""
-
-        result = prompter._extract_clean_claude_md(raw_output)
-
-        assert "Real Content" in result
-        assert "Improvement Task" not in result
-
+This is the actual content.""",
+                "Real Content",
+                "Improvement Task",
+            ),
+        ],
+        ids=["markers", "header-pattern", "meta-text"],
+    )
+    def test_extract_clean_claude_md(
+        self, raw_output: str, expect_in: str, expect_not_in: str
+    ) -> None:
+        """Should keep the CLAUDE.md body and drop the text around it."""
+        result = MetaPrompter._extract_clean_claude_md(raw_output)
 
-class TestClaudeMDOptimizer:
-    """Tests for ClaudeMDOptimizer class."""
+        assert result.startswith("# CLAUDE.md")
+        assert expect_in in result
+        assert expect_not_in not in result
 
-    @pytest.fixture
-    def mock_analysis_responses(self) -> list[str]:
-        """Return mock analysis responses for optimization iterations."""
-        return [
-            # Initial analysis (baseline)
-            """CLARITY: 70
-COMPLETENESS: 65
-ACTIONABILITY: 75
-STANDARDS: 70
-CONTEXT: 60
-OVERALL: 68
-
-STRENGTHS:
-- Basic structure present
-- Clear commands
-
-WEAKNESSES:
-- Missing TDD workflow
-- Incomplete standards
-
-RECOMMENDATIONS:
-- Add TDD details
-- Expand standards section
-
-DETAILED_ANALYSIS:
-Baseline analysis.""",
-            # After iteration 1
-            """CLARITY: 78
-COMPLETENESS: 75
-ACTIONABILITY: 80
-STANDARDS: 82
-CONTEXT: 70
-OVERALL: 77
-
-STRENGTHS:
-- Improved structure
-- Better TDD guidance
-
-WEAKNESSES:
-- Could add more examples
-
-RECOMMENDATIONS:
-- Add code examples
-
-DETAILED_ANALYSIS:
-Improved after iteration 1.""",
-            # After iteration 2
-            """CLARITY: 82
-COMPLETENESS: 80
-ACTIONABILITY: 85
-STANDARDS: 88
-CONTEXT: 78
-OVERALL: 82
-
-STRENGTHS:
-- Excellent TDD workflow
-- Clear examples
-
-WEAKNESSES:
-- Minor gaps remain
-
-RECOMMENDATIONS:
-- Polish documentation
-
-DETAILED_ANALYSIS:
-Further improved.""",
-        ]
+    def test_extract_skips_meta_text_case_insensitively(self) -> None:
+        """Should skip meta-text lines regardless of case when no header pattern matches."""
+        raw_output = """HERE'S THE IMPROVED VERSION:
 
-    @pytest.fixture
-    def mock_improved_contents(self) -> list[str]:
-        """Return mock improved CLAUDE.md contents."""
-        return [
-            """<<<BEGIN_CLAUDE_MD>>>
-# CLAUDE.md
+## current performance
 
-## Project Overview
-Improved in iteration 1.
+## Setup
+Run make."""
 
-## TDD Workflow
-Follow RED-GREEN-REFACTOR.
-<<<END_CLAUDE_MD>>>""",
-            """<<<BEGIN_CLAUDE_MD>>>
-# CLAUDE.md
+        result = MetaPrompter._extract_clean_claude_md(raw_output)
 
-## Project Overview
-Improved in iteration 2.
+        assert result == "## Setup\nRun make."
 
-## TDD Workflow
-Follow RED-GREEN-REFACTOR with examples.
 
-## Examples
-```python
-def test_example():
-    assert True
-```
-<<<END_CLAUDE_MD>>>""",
-        ]
+class TestClaudeMDOptimizer:
+    """Tests for ClaudeMDOptimizer class."""
 
-    def test_optimize_returns_result(
+    def test_optimize_pipeline(
         self,
-        mock_ollama_client: MagicMock,
+        fake_ollama_client: type[FakeOllamaClient],
         sample_claude_md_file: Path,
+        tmp_path: Path,
         mock_analysis_responses: list[str],
         mock_improved_contents: list[str],
     ) -> None:
-        """Should return OptimizationResult after optimization."""
+        """Should track each iteration's improvement and save the best rewrite."""
         # Interleave analysis and improvement responses
         responses = [
             mock_analysis_responses[0],  # Baseline analysis
@@ -324,134 +374,247 @@ def test_example():
             mock_improved_contents[1],  # Second improvement
             mock_analysis_responses[2],  # Analysis of improvement 2
         ]
-        mock_ollama_client.generate.side_effect = responses
+        client = fake_ollama_client(responses)
+        custom_output = tmp_path / "custom_output.md"
 
-        optimizer = ClaudeMDOptimizer(mock_ollama_client)
+        optimizer = ClaudeMDOptimizer(client)
         result = optimizer.optimize(
             claude_md_path=sample_claude_md_file,
             iterations=2,
+            output_path=custom_output,
         )
 
         assert isinstance(result, OptimizationResult)
+        assert len(client.calls) == len(responses)
+
+        # Should show improvement
         assert result.original_score > 0
-        assert result.final_score > 0
+        assert result.final_score > result.original_score
+        assert result.total_improvement > 0
+
+        # Iterations should show progression
         assert len(result.iterations) == 2
-        assert result.output_path is not None
+        assert result.iterations[0].score > result.original_score
+        assert result.iterations[1].score > result.iterations[0].score
+
+        # The best rewrite is saved to the requested path
+        assert result.output_path == custom_output
+        assert "Improved in iteration 2." in result.final_content
+        assert custom_output.read_text() == result.final_content
 
-    def test_optimize_tracks_improvement(
+    def test_optimize_writes_only_the_output_file(
         self,
         mock_ollama_client: MagicMock,
         sample_claude_md_file: Path,
         mock_analysis_responses: list[str],
         mock_improved_contents: list[str],
     ) -> None:
-        """Should track improvement across iterations."""
-        responses = [
+        """Should score rewrites in memory without touching the project directory."""
+        mock_ollama_client.generate.side_effect = [
             mock_analysis_responses[0],
             mock_improved_contents[0],
             mock_analysis_responses[1],
             mock_improved_contents[1],
             mock_analysis_responses[2],
         ]
-        mock_ollama_client.generate.side_effect = responses
+        project_dir = sample_claude_md_file.parent
+        before = {p.name for p in project_dir.iterdir()}
 
         optimizer = ClaudeMDOptimizer(mock_ollama_client)
+        result = optimizer.optimize(claude_md_path=sample_claude_md_file, iterations=2)
+
+        # Without output_path the rewrite goes to CLAUDE.optimized.md beside the original
+        assert result.output_path == project_dir / "CLAUDE.optimized.md"
+        assert {p.name for p in project_dir.iterdir()} - before == {"CLAUDE.optimized.md"}
+
+    @pytest.mark.parametrize("keep_history", [True, False])
+    def test_optimize_selects_best_iteration(
+        self,
+        fake_ollama_client: type[FakeOllamaClient],
+        sample_claude_md_file: Path,
+        keep_history: bool,
+    ) -> None:
+        """Should select the best scoring iteration as final result."""
+        # Create responses where iteration 1 is better than iteration 2
+        responses = [
+            _analysis(60),  # Baseline
+            _improved("Iteration 1 - Best"),
+            _analysis(85),  # After iteration 1 (best)
+            _improved("Iteration 2 - Worse"),
+            _analysis(75, "Regressed"),  # After iteration 2, worse than 1
+        ]
+        client = fake_ollama_client(responses)
+
+        optimizer = ClaudeMDOptimizer(client)
         result = optimizer.optimize(
             claude_md_path=sample_claude_md_file,
             iterations=2,
+            keep_history=keep_history,
         )
 
-        # Should show improvement
-        assert result.final_score > result.original_score
-        assert result.total_improvement > 0
-
-        # Iterations should show progression
-        assert result.iterations[0].score > result.original_score
-        assert result.iterations[1].score > result.iterations[0].score
+        # Should select iteration 1 (score 85) over iteration 2 (score 75)
+        assert result.final_score == 85.0
+        assert "Iteration 1 - Best" in result.final_content
+        assert [it.score for it in result.iterations] == [85.0, 75.0]
+        assert all(bool(it.content) == keep_history for it in result.iterations)
 
-    def test_optimize_saves_output_file(
+    def test_optimize_reuses_score_for_repeated_rewrite(
         self,
         mock_ollama_client: MagicMock,
         sample_claude_md_file: Path,
         mock_analysis_responses: list[str],
         mock_improved_contents: list[str],
     ) -> None:
-        """Should save optimized file to output path."""
+        """Should not re-analyze a rewrite identical to an earlier version."""
         responses = [
             mock_analysis_responses[0],
             mock_improved_contents[0],
             mock_analysis_responses[1],
+            mock_improved_contents[0],  # Model returns the same rewrite again
         ]
         mock_ollama_client.generate.side_effect = responses
 
         optimizer = ClaudeMDOptimizer(mock_ollama_client)
         result = optimizer.optimize(
             claude_md_path=sample_claude_md_file,
-            iterations=1,
+            iterations=2,
         )
 
-        assert result.output_path is not None
-        assert result.output_path.exists()
-        content = result.output_path.read_text()
-        assert "# CLAUDE.md" in content
+        assert mock_ollama_client.generate.call_count == 4
+        assert result.iterations[1].score == result.iterations[0].score
 
-    def test_optimize_uses_custom_output_path(
+    def test_optimize_keeps_best_parallel_candidate(
         self,
         mock_ollama_client: MagicMock,
         sample_claude_md_file: Path,
-        tmp_path: Path,
-        mock_analysis_responses: list[str],
-        mock_improved_contents: list[str],
     ) -> None:
-        """Should use custom output path when provided."""
-        responses = [
-            mock_analysis_responses[0],
-            mock_improved_contents[0],
-            mock_analysis_responses[1],
-        ]
-        mock_ollama_client.generate.side_effect = responses
+        """Should score every candidate and keep the highest-scoring one."""
+        rewrites = iter(
+            [
+                "<<<BEGIN_CLAUDE_MD>>>\n# CLAUDE.md\n\nCandidate Weak\n<<<END_CLAUDE_MD>>>",
+                "<<<BEGIN_CLAUDE_MD>>>\n# CLAUDE.md\n\nCandidate Strong\n<<<END_CLAUDE_MD>>>",
+            ]
+        )
+
+        def respond(*, prompt: str, system: str, **_: object) -> str:
+            # Candidates run concurrently, so answer by prompt content
+            if "optimizing" in system:
+                return next(rewrites)
+            score = 90 if "Candidate Strong" in prompt else 70 if "Candidate Weak" in prompt else 60
+            return f"OVERALL: {score}\n\nSTRENGTHS:\n- Fine\n\nDETAILED_ANALYSIS:\nScored."
+
+        mock_ollama_client.generate.side_effect = respond
 
-        custom_output = tmp_path / "custom_output.md"
         optimizer = ClaudeMDOptimizer(mock_ollama_client)
         result = optimizer.optimize(
             claude_md_path=sample_claude_md_file,
             iterations=1,
-            output_path=custom_output,
+            parallel_candidates=2,
         )
 
-        assert result.output_path == custom_output
-        assert custom_output.exists()
+        assert mock_ollama_client.generate.call_count == 5
+        assert result.final_score == 90.0
+        assert "Candidate Strong" in result.final_content
+        assert not list(sample_claude_md_file.parent.glob(".claude_md_temp_*"))
 
-    def test_optimize_selects_best_iteration(
+    @pytest.mark.parametrize(
+        ("weakest_after_first", "expected_rewrites"),
+        [("CLARITY", 2), ("CONTEXT", 3)],
+    )
+    def test_optimize_speculative_rewrite(
         self,
         mock_ollama_client: MagicMock,
         sample_claude_md_file: Path,
+        weakest_after_first: str,
+        expected_rewrites: int,
     ) -> None:
-        """Should select the best scoring iteration as final result."""
-        # Create responses where iteration 1 is better than iteration 2
-        responses = [
-            # Baseline - 60
-            """CLARITY: 60\nCOMPLETENESS: 60\nACTIONABILITY: 60\nSTANDARDS: 60\nCONTEXT: 60\nOVERALL: 60\n\nSTRENGTHS:\n- Basic\n\nWEAKNESSES:\n- Minimal\n\nRECOMMENDATIONS:\n- Improve\n\nDETAILED_ANALYSIS:\nBaseline.""",
-            # Improvement 1
-            """<<<BEGIN_CLAUDE_MD>>>\n# CLAUDE.md\n\nIteration 1 - Best\n<<<END_CLAUDE_MD>>>""",
-            # After iteration 1 - 85 (best)
-            """CLARITY: 85\nCOMPLETENESS: 85\nACTIONABILITY: 85\nSTANDARDS: 85\nCONTEXT: 85\nOVERALL: 85\n\nSTRENGTHS:\n- Great\n\nWEAKNESSES:\n- None\n\nRECOMMENDATIONS:\n- Keep\n\nDETAILED_ANALYSIS:\nExcellent.""",
-            # Improvement 2
-            """<<<BEGIN_CLAUDE_MD>>>\n# CLAUDE.md\n\nIteration 2 - Worse\n<<<END_CLAUDE_MD>>>""",
-            # After iteration 2 - 75 (worse than 1)
-            """CLARITY: 75\nCOMPLETENESS: 75\nACTIONABILITY: 75\nSTANDARDS: 75\nCONTEXT: 75\nOVERALL: 75\n\nSTRENGTHS:\n- Good\n\nWEAKNESSES:\n- Regressed\n\nRECOMMENDATIONS:\n- Fix\n\nDETAILED_ANALYSIS:\nRegressed.""",
+        """Should keep the speculative rewrite only if the weakest dimension held."""
+        rewrites: list[str] = []
+
+        def scores(weakest: str, low: int, high: int) -> str:
+            dims = ["CLARITY", "COMPLETENESS", "ACTIONABILITY", "STANDARDS", "CONTEXT"]
+            lines = [f"{d}: {low if d == weakest else high}" for d in dims]
+            return "\n".join(lines) + "\n\nSTRENGTHS:\n- Fine\n\nDETAILED_ANALYSIS:\nScored."
+
+        def respond(*, prompt: str, system: str, **_: object) -> str:
+            if "optimizing" in system:
+                rewrites.append(f"Version {len(rewrites) + 1}")
+                return f"<<<BEGIN_CLAUDE_MD>>>\n# CLAUDE.md\n\n{rewrites[-1]}\n<<<END_CLAUDE_MD>>>"
+            if "Version 1" in prompt:
+                return scores(weakest_after_first, 60, 80)
+            if "Version" in prompt:
+                return scores("CLARITY", 85, 90)
+            return scores("CLARITY", 50, 70)
+
+        mock_ollama_client.generate.side_effect = respond
+
+        optimizer = ClaudeMDOptimizer(mock_ollama_client)
+        result = optimizer.optimize(
+            claude_md_path=sample_claude_md_file,
+            iterations=2,
+            speculative=True,
+        )
+
+        assert len(rewrites) == expected_rewrites
+        assert f"Version {expected_rewrites}" in result.final_content
+        assert [it.delta > 0 for it in result.iterations] == [True, True]
+
+    def test_optimize_fused_uses_one_call_per_iteration(
+        self,
+        mock_ollama_client: MagicMock,
+        sample_claude_md_file: Path,
+    ) -> None:
+        """Should score and rewrite together, with one final standalone analysis."""
+
+        def fused(score: int, version: int) -> str:
+            return (
+                f"OVERALL: {score}\nCLARITY: {score}\n\nWEAKNESSES:\n- Gaps\n\n"
+                f"<<<BEGIN_CLAUDE_MD>>>\n# CLAUDE.md\n\nVersion {version}\n<<<END_CLAUDE_MD>>>"
+            )
+
+        mock_ollama_client.generate.side_effect = [
+            fused(60, 1),  # Evaluates the original, drafts version 1
+            fused(75, 2),  # Evaluates version 1, drafts version 2
+            "CLARITY: 85\nOVERALL: 85\n\nSTRENGTHS:\n- Solid",  # Final analysis
         ]
-        mock_ollama_client.generate.side_effect = responses
 
         optimizer = ClaudeMDOptimizer(mock_ollama_client)
         result = optimizer.optimize(
             claude_md_path=sample_claude_md_file,
             iterations=2,
+            fused=True,
         )
 
-        # Should select iteration 1 (score 85) over iteration 2 (score 75)
-        assert result.final_score == 85.0
-        assert "Iteration 1 - Best" in result.final_content
+        assert mock_ollama_client.generate.call_count == 3
+        assert result.original_score == 60.0
+        assert [it.score for it in result.iterations] == [75.0, 85.0]
+        assert "Version 2" in result.final_content
+
+    def test_optimize_rejects_speculation_with_candidates(
+        self,
+        mock_ollama_client: MagicMock,
+        sample_claude_md_file: Path,
+    ) -> None:
+        """Should not combine speculative rewrites with parallel candidates."""
+        optimizer = ClaudeMDOptimizer(mock_ollama_client)
+
+        with pytest.raises(ValueError):
+            optimizer.optimize(
+                claude_md_path=sample_claude_md_file,
+                parallel_candidates=2,
+                speculative=True,
+            )
+
+    def test_optimize_rejects_zero_candidates(
+        self,
+        mock_ollama_client: MagicMock,
+        sample_claude_md_file: Path,
+    ) -> None:
+        """Should reject a candidate count below one."""
+        optimizer = ClaudeMDOptimizer(mock_ollama_client)
+
+        with pytest.raises(ValueError):
+            optimizer.optimize(claude_md_path=sample_claude_md_file, parallel_candidates=0)
 
 
 class TestOptimizeCommand:
@@ -459,8 +622,6 @@ class TestOptimizeCommand:
 
     def test_optimize_command_exists(self) -> None:
         """Should have optimize command registered."""
-        from claude_md_bench.cli import app
-
         commands = list(app.registered_commands)
         command_names = [cmd.name or cmd.callback.__name__ for cmd in commands]
 
@@ -468,41 +629,25 @@ class TestOptimizeCommand:
 
     def test_optimize_command_requires_file(self) -> None:
         """Should require file argument."""
-        from typer.testing import CliRunner
-
-        from claude_md_bench.cli import app
-
-        runner = CliRunner()
         result = runner.invoke(app, ["optimize"])
 
         assert result.exit_code != 0
         assert "Missing argument" in result.stdout or "FILE" in result.stdout
 
-    @patch("claude_md_bench.commands.optimize.OllamaClient")
     def test_optimize_command_workflow(
         self,
-        mock_client_class: MagicMock,
+        patched_client: MagicMock,
         sample_claude_md_file: Path,
     ) -> None:
         """Should complete optimization workflow and save output file."""
-        from typer.testing import CliRunner
-
-        from claude_md_bench.cli import app
-
         # Setup mock responses for: baseline analysis, improvement, improved analysis
-        mock_client = MagicMock()
-        mock_client.check_health.return_value = True
-        mock_client.generate.side_effect = [
-            # Baseline analysis
-            """CLARITY: 70\nCOMPLETENESS: 65\nACTIONABILITY: 75\nSTANDARDS: 70\nCONTEXT: 60\nOVERALL: 68\n\nSTRENGTHS:\n- Basic structure\n\nWEAKNESSES:\n- Missing details\n\nRECOMMENDATIONS:\n- Add more\n\nDETAILED_ANALYSIS:\nBaseline.""",
-            # Improved content
-            """<<<BEGIN_CLAUDE_MD>>>\n# CLAUDE.md\n\n## Improved\nBetter content.\n<<<END_CLAUDE_MD>>>""",
-            # Improved analysis
-            """CLARITY: 80\nCOMPLETENESS: 78\nACTIONABILITY: 82\nSTANDARDS: 85\nCONTEXT: 75\nOVERALL: 80\n\nSTRENGTHS:\n- Better structure\n\nWEAKNESSES:\n- Minor gaps\n\nRECOMMENDATIONS:\n- Polish\n\nDETAILED_ANALYSIS:\nImproved.""",
+        patched_client.check_health.return_value = True
+        patched_client.generate.side_effect = [
+            _analysis(68, "Missing details"),  # Baseline analysis
+            _improved("## Improved\nBetter content."),
+            _analysis(80),  # Improved analysis
         ]
-        mock_client_class.return_value = mock_client
 
-        runner = CliRunner()
         result = runner.invoke(
             app,
             ["optimize", str(sample_claude_md_file), "--iterations", "1", "--quiet"],
@@ -519,23 +664,15 @@ class TestOptimizeCommand:
         content = output_file.read_text()
         assert "# CLAUDE.md" in content
 
-    @patch("claude_md_bench.commands.optimize.OllamaClient")
     def test_optimize_command_ollama_not_running(
         self,
-        mock_client_class: MagicMock,
+        patched_client: MagicMock,
         sample_claude_md_file: Path,
     ) -> None:
         """Should show error when Ollama is not running."""
-        from typer.testing import CliRunner
-
-        from claude_md_bench.cli import app
-
-        mock_client = MagicMock()
-        mock_client.check_health.return_value = False
-        mock_client.list_models.return_value = []
-        mock_client_class.return_value = mock_client
+        patched_client.check_health.return_value = False
+        patched_client.list_models.return_value = []
 
-        runner = CliRunner()
         result = runner.invoke(
             app,
             ["optimize", str(sample_claude_md_file)],